@@ -3,36 +3,47 @@ SkillSense - Streamlit Dashboard
 AI-powered skill extraction and career matching platform
 """
 import streamlit as st
-import plotly.graph_objects as go
-import plotly.express as px
 from pathlib import Path
 import sys
 import json
 import os
+import atexit
+import hashlib
+import re
+import shutil
+import tempfile
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import Optional
+import numpy as np
 
-# Load environment variables from .env file
+# orjson is an optional, faster drop-in for the JSON export
 try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except Exception:
-    # If dotenv fails, try manual loading
-    env_file = Path(__file__).parent / '.env'
-    if env_file.exists():
-        with open(env_file) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ[key.strip()] = value.strip()
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add src to path
 sys.path.append(str(Path(__file__).parent / 'src'))
 
-from profile_generation.profile_builder import ProfileBuilder
-from analysis.job_matcher import JobMatcher
-from rag.rag_system import RAGSystem
 from rag.prompts import QUICK_QUESTIONS
+from src.visualization import (
+    create_info_card,
+    create_info_card_html,
+    create_job_cards_grid,
+    create_match_score_gauge,
+    create_metric_grid,
+    create_profile_completeness_gauge,
+    create_radar_chart,
+    create_required_vs_preferred,
+    create_skill_badge_html,
+    create_skill_detail_card_html,
+    create_skills_gap_waterfall,
+    create_skills_portfolio_bubble,
+    create_source_relevance_chart,
+    get_confidence_color,
+)
 
 
 # Page configuration
@@ -43,53 +54,164 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+
+@st.cache_resource(show_spinner=False)
+def load_env():
+    """Load environment variables from .env once per server process, not on every rerun"""
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except Exception:
+        # If dotenv fails, try manual loading
+        env_file = Path(__file__).parent / '.env'
+        if env_file.exists():
+            with open(env_file) as f:
+                os.environ.update({
+                    key.strip(): value.strip()
+                    for key, value in (
+                        line.split('=', 1)
+                        for line in map(str.strip, f)
+                        if line and line[0] != '#' and '=' in line
+                    )
+                })
+
+
+load_env()
+
+
+@st.cache_resource
+def temp_cv_paths() -> dict:
+    """Temp copies of uploaded CVs keyed by content hash, removed when the server process exits"""
+    paths = {}
+
+    @atexit.register
+    def _remove_temp_cvs():
+        for path in paths.values():
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+    return paths
+
+
+@st.cache_resource
+def load_app_css() -> str:
+    """Read the app stylesheet once per server process"""
+    css = (Path(__file__).parent / 'static' / 'app.css').read_text(encoding='utf-8')
+    return f"<style>\n{css}</style>"
+
+
 # Custom CSS
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 3rem;
-        font-weight: bold;
-        color: #1f77b4;
-        text-align: center;
-        margin-bottom: 0.5rem;
-    }
-    .sub-header {
-        font-size: 1.2rem;
-        color: #666;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    .skill-badge {
-        display: inline-block;
-        padding: 0.25rem 0.75rem;
-        margin: 0.25rem;
-        border-radius: 1rem;
-        font-size: 0.9rem;
-    }
-    .skill-high {
-        background-color: #28a745;
-        color: white;
-    }
-    .skill-medium {
-        background-color: #ffc107;
-        color: black;
+st.markdown(load_app_css(), unsafe_allow_html=True)
+
+
+@st.cache_resource
+def get_profile_builder():
+    """Shared ProfileBuilder instance, constructed once per server process"""
+    # Imported lazily: pulls in the NLP extraction stack
+    from profile_generation.profile_builder import ProfileBuilder
+    return ProfileBuilder()
+
+
+@st.cache_resource
+def get_job_matcher():
+    """Shared JobMatcher instance, constructed once per server process"""
+    from analysis.job_matcher import JobMatcher
+    return JobMatcher()
+
+
+def skills_key(skills) -> tuple:
+    """Order-independent, hashable fingerprint of a skill list, used to key cached computations"""
+    return tuple(sorted((s.skill_name, round(s.final_confidence, 3)) for s in skills))
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def match_jobs(key: tuple, _skills, top_n: int = 10):
+    """
+    Match skills to job roles, cached per skill fingerprint
+
+    Args:
+        key: skills_key() of the skills being matched
+        _skills: The ScoredSkill list itself (not hashed by Streamlit)
+        top_n: Number of top matches to return
+    """
+    return get_job_matcher().match_profile_to_jobs(_skills, top_n=top_n)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def find_skill_gaps(key: tuple, _skills, target_job: str) -> dict:
+    """Gap analysis for a target job, cached per skill fingerprint and job"""
+    return get_job_matcher().identify_skill_gaps(_skills, target_job)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def match_orders(key: tuple, _matches) -> dict:
+    """
+    Index orderings of a match list for each sort option, cached per skill fingerprint
+
+    Args:
+        key: skills_key() of the skills the matches were computed for
+        _matches: JobMatch list from match_jobs(), highest score first (not hashed by Streamlit)
+
+    Returns:
+        Dict of sort option label -> tuple of indices into the match list
+    """
+    indices = range(len(_matches))
+    return {
+        "Match Score (Highest)": tuple(indices),
+        "Match Score (Lowest)": tuple(sorted(indices, key=lambda i: _matches[i].match_score)),
+        "Alphabetical": tuple(sorted(indices, key=lambda i: _matches[i].job_title)),
     }
-    .skill-low {
-        background-color: #dc3545;
-        color: white;
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def match_titles(key: tuple, _matches) -> tuple:
+    """Titles of the top 10 matches, in match order, for the gap-analysis role picker"""
+    return tuple(match.job_title for match in islice(_matches, 10))
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def match_index(key: tuple, _matches) -> dict:
+    """Title -> JobMatch lookup for the gap-analysis tab, cached per skill fingerprint"""
+    return {match.job_title: match for match in _matches}
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def opportunity_bubble_data(key: tuple, _matches) -> dict:
+    """Bubble chart input for the top 6 matches: truncated title -> (match_score, matched_count)"""
+    return {
+        match.job_title[:20]: (match.match_score, len(match.matched_skills))
+        for match in islice(_matches, 6)
     }
-</style>
-""", unsafe_allow_html=True)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def match_gap_stats(key: tuple, _matches) -> tuple:
+    """
+    Average missing-skill count and number of distinct missing skills across matches, in one pass
+
+    Args:
+        key: skills_key() of the skills the matches were computed for
+        _matches: JobMatch list from match_jobs() (not hashed by Streamlit)
+
+    Returns:
+        (avg_gap, unique_gap_count)
+    """
+    total_gaps = 0
+    unique_gaps = set()
+    for match in _matches:
+        total_gaps += len(match.missing_required) + len(match.missing_preferred)
+        unique_gaps.update(match.missing_required)
+        unique_gaps.update(match.missing_preferred)
+    return (total_gaps / len(_matches) if _matches else 0), len(unique_gaps)
 
 
 def initialize_session_state():
     """Initialize session state variables"""
     if 'profile' not in st.session_state:
         st.session_state.profile = None
-    if 'profile_builder' not in st.session_state:
-        st.session_state.profile_builder = ProfileBuilder()
-    if 'job_matcher' not in st.session_state:
-        st.session_state.job_matcher = JobMatcher()
+    # ProfileBuilder/JobMatcher are built on first use by the pages that need them
 
 
 def render_header():
@@ -98,6 +220,59 @@ def render_header():
     st.markdown('<div class="sub-header">Unlock Your Hidden Potential with AI-Powered Skill Analysis</div>', unsafe_allow_html=True)
 
 
+_WORD_RE = re.compile(r'\S+')
+
+
+def word_count(text: str) -> int:
+    """Count whitespace-separated words without building a list of them"""
+    return _WORD_RE.subn('', text)[1]
+
+
+# Uploads up to this size are written in one call; larger ones are streamed in chunks
+TEMP_CV_DIRECT_WRITE_LIMIT = 8 << 20
+
+
+def write_temp_cv(cv_file) -> str:
+    """Copy an upload into a unique OS temp file and return its path"""
+    fd, path = tempfile.mkstemp(prefix="temp_cv_", suffix=".pdf")
+    with os.fdopen(fd, 'wb') as f:
+        if cv_file.size <= TEMP_CV_DIRECT_WRITE_LIMIT:
+            f.write(cv_file.getbuffer())
+        else:
+            # Stream in 1 MiB chunks to bound the extra memory for large PDFs
+            cv_file.seek(0)
+            shutil.copyfileobj(cv_file, f, length=1 << 20)
+    return path
+
+
+# Temp CVs kept on disk across all sessions; older ones are unlinked past this count
+TEMP_CV_REGISTRY_LIMIT = 64
+
+
+def evict_temp_cvs(registry: dict, current: dict) -> None:
+    """Mark the current uploads (digest -> path) as most recent, then unlink the oldest temp CVs past the limit"""
+    for digest, path in current.items():
+        registry.pop(digest, None)
+        registry[digest] = path
+    for digest in list(islice(registry, max(0, len(registry) - TEMP_CV_REGISTRY_LIMIT))):
+        path = registry.pop(digest, None)
+        if path:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+
+SOURCE_CARD_TEMPLATE = (
+    '<div class="source-card source-card-{kind}">'
+    '<div class="source-card-icon">{icon}</div>'
+    '<div class="source-card-title">{title}</div>'
+    '<div class="source-card-value">{value}</div>'
+    '<div class="source-card-caption">{caption}</div>'
+    '</div>'
+)
+
+
 def render_data_input_page():
     """Render data input page - supports simultaneous multi-source input with preview cards"""
     st.header("📊 Data Input & Source Collection")
@@ -111,7 +286,6 @@ def render_data_input_page():
     inputs = {}
 
     # Info card about multi-source benefits
-    from src.visualization import create_info_card
     create_info_card(
         title="Why Multiple Sources Matter",
         content="Combining CV, GitHub, personal statement, and references provides a holistic view of your skills. Each source reveals different aspects of your expertise.",
@@ -119,7 +293,7 @@ def render_data_input_page():
         icon="💡"
     )
 
-    st.markdown("---")
+    st.divider()
     st.subheader("🎯 Select Your Data Sources")
 
     # Progress indicator
@@ -138,14 +312,21 @@ def render_data_input_page():
 
     cv_preview = ""
     if cv_files:
-        import uuid
-        cv_paths = []
-        for idx, cv_file in enumerate(cv_files):
-            # Generate unique temp file name
-            temp_path = Path(f"temp_cv_{uuid.uuid4().hex[:8]}.pdf")
-            with open(temp_path, 'wb') as f:
-                f.write(cv_file.getbuffer())
-            cv_paths.append(str(temp_path))
+        registry = temp_cv_paths()
+        digests = [hashlib.sha256(cv_file.getbuffer()).hexdigest() for cv_file in cv_files]
+
+        # Only content not already written on an earlier rerun needs a temp file
+        pending = {
+            digest: cv_file for digest, cv_file in zip(digests, cv_files)
+            if not os.path.exists(registry.get(digest, ''))
+        }
+        if pending:
+            # File writes release the GIL, so several uploads are written concurrently
+            with ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+                registry.update(zip(pending, executor.map(write_temp_cv, pending.values())))
+
+        cv_paths = [registry[digest] for digest in digests]
+        evict_temp_cvs(registry, dict(zip(digests, cv_paths)))
 
         inputs['cv_paths'] = cv_paths
         cv_preview = f"✅ {len(cv_paths)} CV file(s) uploaded"
@@ -153,7 +334,7 @@ def render_data_input_page():
         with col_progress1:
             st.metric("CVs", len(cv_paths), delta=None)
 
-    st.markdown("---")
+    st.divider()
 
     # Section 2: GitHub Connection
     st.subheader("💻 GitHub Profile")
@@ -171,7 +352,7 @@ def render_data_input_page():
         with col_progress2:
             st.metric("GitHub", "Connected", delta=None)
 
-    st.markdown("---")
+    st.divider()
 
     # Section 3: Text Input
     st.subheader("✍️ Written Background")
@@ -211,98 +392,37 @@ def render_data_input_page():
         with col_progress4:
             st.metric("Reference", "Added", delta=None)
 
-    st.markdown("---")
+    st.divider()
 
     # Display data collection summary with preview cards
     if inputs:
         st.subheader("📋 Data Collection Summary")
 
-        # Create preview cards in a responsive grid
-        preview_cols = st.columns(min(len(inputs), 4))
-
-        source_idx = 0
-        if 'cv_paths' in inputs and source_idx < len(preview_cols):
-            with preview_cols[source_idx]:
-                cv_card = f"""
-                <div style="
-                    padding: 1.5rem;
-                    border-radius: 12px;
-                    background: linear-gradient(135deg, #DBEAFE 0%, #BFDBFE 100%);
-                    border: 2px solid #3B82F6;
-                    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.07);
-                    text-align: center;
-                ">
-                    <div style="font-size: 2rem; margin-bottom: 0.5rem;">📄</div>
-                    <div style="font-weight: 700; color: #1E40AF; margin-bottom: 0.5rem;">CV Document(s)</div>
-                    <div style="font-size: 2rem; font-weight: 700; color: #3B82F6; margin-bottom: 0.5rem;">{len(inputs['cv_paths'])}</div>
-                    <div style="font-size: 0.875rem; color: #1E40AF;">files uploaded</div>
-                </div>
-                """
-                st.markdown(cv_card, unsafe_allow_html=True)
-            source_idx += 1
-
-        if 'github_username' in inputs and source_idx < len(preview_cols):
-            with preview_cols[source_idx]:
-                gh_card = f"""
-                <div style="
-                    padding: 1.5rem;
-                    border-radius: 12px;
-                    background: linear-gradient(135deg, #F3F4F6 0%, #E5E7EB 100%);
-                    border: 2px solid #374151;
-                    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.07);
-                    text-align: center;
-                ">
-                    <div style="font-size: 2rem; margin-bottom: 0.5rem;">💻</div>
-                    <div style="font-weight: 700; color: #111827; margin-bottom: 0.5rem;">GitHub Profile</div>
-                    <div style="font-size: 1.5rem; font-weight: 700; color: #374151; margin-bottom: 0.5rem; word-break: break-all;">{inputs['github_username']}</div>
-                    <div style="font-size: 0.875rem; color: #374151;">connected</div>
-                </div>
-                """
-                st.markdown(gh_card, unsafe_allow_html=True)
-            source_idx += 1
-
-        if 'personal_statement' in inputs and source_idx < len(preview_cols):
-            with preview_cols[source_idx]:
-                stmt_length = len(inputs['personal_statement'].split())
-                stmt_card = f"""
-                <div style="
-                    padding: 1.5rem;
-                    border-radius: 12px;
-                    background: linear-gradient(135deg, #E0E7FF 0%, #DDD6FE 100%);
-                    border: 2px solid #6366F1;
-                    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.07);
-                    text-align: center;
-                ">
-                    <div style="font-size: 2rem; margin-bottom: 0.5rem;">✍️</div>
-                    <div style="font-weight: 700; color: #3730A3; margin-bottom: 0.5rem;">Personal Statement</div>
-                    <div style="font-size: 2rem; font-weight: 700; color: #6366F1; margin-bottom: 0.5rem;">{stmt_length}</div>
-                    <div style="font-size: 0.875rem; color: #3730A3;">words added</div>
-                </div>
-                """
-                st.markdown(stmt_card, unsafe_allow_html=True)
-            source_idx += 1
-
-        if 'reference_letter' in inputs and source_idx < len(preview_cols):
-            with preview_cols[source_idx]:
-                ref_length = len(inputs['reference_letter'].split())
-                ref_card = f"""
-                <div style="
-                    padding: 1.5rem;
-                    border-radius: 12px;
-                    background: linear-gradient(135deg, #FEE2E2 0%, #FECACA 100%);
-                    border: 2px solid #EF4444;
-                    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.07);
-                    text-align: center;
-                ">
-                    <div style="font-size: 2rem; margin-bottom: 0.5rem;">📋</div>
-                    <div style="font-weight: 700; color: #7F1D1D; margin-bottom: 0.5rem;">Reference Letter</div>
-                    <div style="font-size: 2rem; font-weight: 700; color: #EF4444; margin-bottom: 0.5rem;">{ref_length}</div>
-                    <div style="font-size: 0.875rem; color: #7F1D1D;">words added</div>
-                </div>
-                """
-                st.markdown(ref_card, unsafe_allow_html=True)
+        # Preview cards share one grid and one markdown element; styling lives in static/app.css
+        cards = []
+        if 'cv_paths' in inputs:
+            cards.append(SOURCE_CARD_TEMPLATE.format(
+                kind="cv", icon="📄", title="CV Document(s)",
+                value=len(inputs['cv_paths']), caption="files uploaded"
+            ))
+        if 'github_username' in inputs:
+            cards.append(SOURCE_CARD_TEMPLATE.format(
+                kind="github", icon="💻", title="GitHub Profile",
+                value=inputs['github_username'], caption="connected"
+            ))
+        if 'personal_statement' in inputs:
+            cards.append(SOURCE_CARD_TEMPLATE.format(
+                kind="statement", icon="✍️", title="Personal Statement",
+                value=word_count(inputs['personal_statement']), caption="words added"
+            ))
+        if 'reference_letter' in inputs:
+            cards.append(SOURCE_CARD_TEMPLATE.format(
+                kind="reference", icon="📋", title="Reference Letter",
+                value=word_count(inputs['reference_letter']), caption="words added"
+            ))
+        st.markdown(f'<div class="source-cards">{"".join(cards)}</div>', unsafe_allow_html=True)
 
-        st.markdown("---")
+        st.divider()
 
         # Data quality indicator
         data_quality_score = 0
@@ -379,8 +499,49 @@ def render_data_input_page():
     return None
 
 
+def _text_digest(text: Optional[str]) -> Optional[str]:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest() if text else None
+
+
+def profile_build_key(inputs: dict) -> tuple:
+    """Fingerprint of everything build_profile reads, to detect unchanged inputs"""
+    return (
+        inputs.get('name'),
+        # Temp CV paths are content-addressed, so they stand in for the file hashes
+        tuple(inputs.get('cv_paths', ())),
+        inputs.get('github_username'),
+        _text_digest(inputs.get('personal_statement')),
+        _text_digest(inputs.get('reference_letter')),
+    )
+
+
+def requested_sources(inputs: dict) -> set:
+    """The profile data_sources entries a build from these inputs should produce"""
+    return {
+        source for source, field in (
+            ('cv', 'cv_paths'),
+            ('github', 'github_username'),
+            ('personal_statement', 'personal_statement'),
+            ('reference_letter', 'reference_letter'),
+        )
+        if inputs.get(field)
+    }
+
+
 def build_profile_from_inputs(inputs: dict):
     """Build profile from user inputs - supports multi-source simultaneous processing"""
+    # Same CVs and text as the current profile, and every source made it in:
+    # skip PDF parsing and extraction entirely
+    build_key = profile_build_key(inputs)
+    profile = st.session_state.profile
+    if (
+        profile is not None
+        and st.session_state.get('profile_build_key') == build_key
+        and requested_sources(inputs) <= set(profile.data_sources)
+    ):
+        st.success("Profile is already up to date with these inputs.")
+        return True
+
     # Display processing progress
     sources_to_process = []
     if inputs.get('cv_paths'):
@@ -397,7 +558,7 @@ def build_profile_from_inputs(inputs: dict):
     with st.spinner(f"🔍 {progress_text}..."):
         try:
             # Build profile with all sources
-            profile = st.session_state.profile_builder.build_profile(
+            profile = get_profile_builder().build_profile(
                 name=inputs.get('name', 'User'),
                 cv_paths=inputs.get('cv_paths'),  # Now supports multiple CVs
                 github_username=inputs.get('github_username'),
@@ -405,6 +566,12 @@ def build_profile_from_inputs(inputs: dict):
                 reference_letter=inputs.get('reference_letter')
             )
             st.session_state.profile = profile
+            # Only remember the inputs when every source succeeded, so a failed one
+            # (e.g. a GitHub network error) is retried on the next click
+            if requested_sources(inputs) <= set(profile.data_sources):
+                st.session_state.profile_build_key = build_key
+            else:
+                st.session_state.pop('profile_build_key', None)
 
             # Show success with source breakdown
             st.success("Profile analysis complete!")
@@ -438,7 +605,6 @@ def render_skill_profile_page():
     st.header("🎓 Your Skill Profile")
 
     # Profile Summary Card
-    from src.visualization import create_info_card
     create_info_card(
         title="Profile Overview",
         content=profile.summary,
@@ -446,13 +612,12 @@ def render_skill_profile_page():
         icon="📊"
     )
 
-    st.markdown("---")
+    st.divider()
 
     # Metrics Row - Using styled metric cards
-    from src.visualization import create_metric_grid
-    high_confidence = len([s for s in profile.skills if s.final_confidence >= 0.75])
-    medium_confidence = len([s for s in profile.skills if 0.5 <= s.final_confidence < 0.75])
-    low_confidence = len([s for s in profile.skills if s.final_confidence < 0.5])
+    high_confidence = profile.level_counts['high']
+    medium_confidence = profile.level_counts['medium']
+    low_confidence = profile.level_counts['low']
 
     metrics = [
         {"label": "Total Skills", "value": len(profile.skills), "icon": "📊", "color": "primary"},
@@ -460,13 +625,26 @@ def render_skill_profile_page():
         {"label": "Medium Confidence", "value": medium_confidence, "icon": "🟡", "color": "warning"},
         {"label": "Low Confidence", "value": low_confidence, "icon": "🔴", "color": "error"},
         {"label": "Data Sources", "value": len(profile.data_sources), "icon": "📁", "color": "secondary"},
-        {"label": "Evidence Trails", "value": sum(len(s.evidence) for s in profile.skills), "icon": "🔍", "color": "info"},
+        {"label": "Evidence Trails", "value": profile.evidence_count, "icon": "🔍", "color": "info"},
     ]
 
     create_metric_grid(metrics, columns=3)
 
-    st.markdown("---")
+    st.divider()
+
+    # Top Skills Radar - hashable (name, confidence) pairs so the figure is cached
+    st.subheader("🕸️ Top Skills at a Glance")
+    top_pairs = tuple((s.skill_name, s.final_confidence) for s in islice(profile.top_skills, 10))
+    st.plotly_chart(create_radar_chart(top_pairs), use_container_width=True, key="skill_radar")
+
+    st.divider()
+
+    render_skill_explorer(profile)
 
+
+@st.fragment
+def render_skill_explorer(profile):
+    """Render the skill filters and filtered views; a fragment, so filter changes rerun only this block"""
     # Interactive Filters
     st.subheader("🎯 Filter & Explore Skills")
 
@@ -483,7 +661,7 @@ def render_skill_profile_page():
         )
 
     with col_filter2:
-        categories = ["All"] + sorted([cat.replace('_', ' ').title() for cat in profile.skill_categories.keys()])
+        categories = ["All", *profile.category_labels.values()]
         selected_category = st.selectbox(
             "Filter by Category",
             categories,
@@ -491,12 +669,8 @@ def render_skill_profile_page():
         )
 
     with col_filter3:
-        # Extract unique sources from all skills
-        all_sources = set()
-        for skill in profile.skills:
-            if hasattr(skill, 'sources'):
-                all_sources.update(skill.sources)
-        sources_list = ["All"] + sorted(list(all_sources)) if all_sources else ["All"]
+        # Unique sources across all skills, collected once at profile build time
+        sources_list = ["All"] + profile.skill_sources
 
         selected_source = st.selectbox(
             "Filter by Source",
@@ -504,26 +678,21 @@ def render_skill_profile_page():
             key="skill_source_filter"
         )
 
-    st.markdown("---")
+    st.divider()
 
     # Detailed Skills by Category with Badges
     st.subheader("📚 Skills by Category")
 
-    for category, skills in profile.skill_categories.items():
-        # Apply filters
-        filtered_skills = [
-            s for s in skills
-            if s.final_confidence >= confidence_min
-            and (selected_category == "All" or category.replace('_', ' ').title() == selected_category)
-        ]
+    for category, filtered_skills in profile.categories_above(confidence_min).items():
+        # Apply category filter; the confidence filter is memoized on the profile
+        category_label = profile.category_labels[category]
+        if selected_category != "All" and category_label != selected_category:
+            continue
 
         if filtered_skills:
-            from src.visualization import create_category_section, create_skill_badge_html
-
-            sorted_skills = sorted(filtered_skills, key=lambda x: x.final_confidence, reverse=True)
-
+            # Category lists are pre-sorted by confidence at profile build time
             with st.expander(
-                f"{category.replace('_', ' ').title()} ({len(sorted_skills)} skills)",
+                f"{category_label} ({len(filtered_skills)} skills)",
                 expanded=False
             ):
                 # Display skills as badges
@@ -531,41 +700,34 @@ def render_skill_profile_page():
                     create_skill_badge_html(
                         skill.skill_name,
                         skill.final_confidence,
-                        category.replace('_', ' ').title()
+                        category_label
                     )
-                    for skill in sorted_skills[:20]
+                    for skill in islice(filtered_skills, 20)
                 ])
                 st.markdown(skill_badges, unsafe_allow_html=True)
 
-    st.markdown("---")
+    st.divider()
 
     # Detailed Evidence View
     st.subheader("🔍 Detailed Evidence & Sources")
 
-    for skill in profile.top_skills[:15]:
+    detail_cards = []
+    for skill in islice(profile.top_skills, 15):
         if skill.final_confidence >= confidence_min:
-            # Create evidence text list from skill object
-            evidence_list = []
-            if hasattr(skill, 'evidence'):
-                for ev in skill.evidence[:3]:
-                    if isinstance(ev, str):
-                        evidence_list.append(ev)
-                    elif hasattr(ev, 'text'):
-                        evidence_list.append(ev.text)
-                    elif hasattr(ev, '__str__'):
-                        evidence_list.append(str(ev))
-
-            # Get category from skill object if available
-            category = skill.category if hasattr(skill, 'category') else "Unknown"
-
-            from src.visualization import create_skill_detail_card
-            create_skill_detail_card(
+            # ScoredSkill always carries evidence strings and a category
+            evidence_list = list(islice(skill.evidence, 3))
+
+            detail_cards.append(create_skill_detail_card_html(
                 skill_name=skill.skill_name,
                 confidence=skill.final_confidence,
-                category=category,
+                category=skill.category,
                 sources=skill.sources,
                 evidence=evidence_list
-            )
+            ))
+
+    # One markdown element for all cards instead of one per skill
+    if detail_cards:
+        st.markdown("".join(detail_cards), unsafe_allow_html=True)
 
 
 def render_job_matching_page():
@@ -575,29 +737,79 @@ def render_job_matching_page():
         return
 
     profile = st.session_state.profile
-    matcher = st.session_state.job_matcher
+    match_key = skills_key(profile.skills)
 
     st.header("💼 Job Matching & Career Recommendations")
 
     # Get job matches
     with st.spinner("🔎 Finding best job matches..."):
-        matches = matcher.match_profile_to_jobs(profile.skills, top_n=10)
+        matches = match_jobs(match_key, profile.skills, top_n=10)
 
     # Metrics summary
-    from src.visualization import create_metric_grid
-    avg_match_score = sum(m.match_score for m in matches) / len(matches) if matches else 0
-    perfect_matches = len([m for m in matches if m.match_score >= 0.8])
+    # Score column aligned with `matches`, reused by the metrics and the threshold filter
+    match_scores = np.fromiter((m.match_score for m in matches), dtype=np.float64, count=len(matches))
+    avg_match_score = match_scores.mean() if matches else 0
+    perfect_matches = np.count_nonzero(match_scores >= 0.8)
 
     metrics = [
-        {"label": "Best Match Score", "value": f"{max(m.match_score for m in matches) * 100:.0f}%" if matches else "N/A", "icon": "🏆", "color": "success"},
+        {"label": "Best Match Score", "value": f"{match_scores.max() * 100:.0f}%" if matches else "N/A", "icon": "🏆", "color": "success"},
         {"label": "Average Match", "value": f"{avg_match_score * 100:.0f}%", "icon": "📊", "color": "primary"},
         {"label": "Excellent Matches (80%+)", "value": perfect_matches, "icon": "🎯", "color": "secondary"},
     ]
 
     create_metric_grid(metrics, columns=3)
 
-    st.markdown("---")
+    st.divider()
+
+    render_job_explorer(match_key, matches, match_scores)
+
+    st.divider()
 
+    # Detailed Job Analysis
+    st.subheader("📊 Detailed Analysis & Visualizations")
+
+    if matches:
+        # Create tabs for different analyses
+        tab1, tab2, tab3 = st.tabs(["Match Scores", "Skill Gaps", "Opportunity Analysis"])
+
+        with tab1:
+            st.markdown("#### Match Score Gauges")
+            # Show gauges for top 3-5 jobs
+            cols = st.columns(min(3, len(matches)))
+            for idx, (col, match) in enumerate(zip(cols, matches)):
+                with col:
+                    fig_gauge = create_match_score_gauge(match.match_score, match.job_title)
+                    st.plotly_chart(fig_gauge, use_container_width=True, key=f"match_gauge_{idx}")
+
+        with tab2:
+            render_gap_analysis(match_key, profile.skills, matches)
+
+        with tab3:
+            st.markdown("#### Opportunity Analysis")
+
+            # Show comparison across multiple jobs
+            if len(matches) > 1:
+                category_data = opportunity_bubble_data(match_key, matches)
+
+                if category_data:
+                    fig_bubble = create_skills_portfolio_bubble(category_data)
+                    st.plotly_chart(fig_bubble, use_container_width=True, key="opportunity_bubble")
+
+            # Summary statistics
+            st.markdown("#### Career Path Statistics")
+
+            avg_gap, total_unique_gaps = match_gap_stats(match_key, matches)
+
+            create_metric_grid([
+                {"label": "Total Opportunities", "value": len(matches), "icon": "💼", "color": "primary"},
+                {"label": "Avg Skills to Develop", "value": f"{avg_gap:.1f}", "icon": "📈", "color": "warning"},
+                {"label": "Unique Skills Needed", "value": total_unique_gaps, "icon": "🎯", "color": "secondary"},
+            ], columns=3)
+
+
+@st.fragment
+def render_job_explorer(match_key: tuple, matches, match_scores):
+    """Render the match filters and job card grid; a fragment, so filter changes rerun only this block"""
     # Match Score Threshold Filter
     st.subheader("🎯 Explore Opportunities")
 
@@ -620,24 +832,18 @@ def render_job_matching_page():
             key="job_sort"
         )
 
-    # Filter and sort matches
-    filtered_matches = [m for m in matches if m.match_score >= match_threshold]
-
-    if sort_by == "Alphabetical":
-        filtered_matches = sorted(filtered_matches, key=lambda x: x.job_title)
-    elif sort_by == "Match Score (Lowest)":
-        filtered_matches = sorted(filtered_matches, key=lambda x: x.match_score)
+    # Filter over a cached ordering instead of re-sorting on every interaction
+    passing = match_scores >= match_threshold
+    filtered_matches = [matches[i] for i in match_orders(match_key, matches)[sort_by] if passing[i]]
 
-    st.markdown("---")
+    st.divider()
 
     # Job Cards Grid
     st.subheader(f"💼 Top Opportunities ({len(filtered_matches)} matches)")
 
     if filtered_matches:
-        from src.visualization import create_job_cards_grid
-
         job_data = []
-        for match in filtered_matches[:9]:  # Show top 9 in grid
+        for match in islice(filtered_matches, 9):  # Show top 9 in grid
             job_data.append({
                 "title": match.job_title,
                 "company": "",
@@ -650,177 +856,168 @@ def render_job_matching_page():
     else:
         st.info("No matches found with your selected criteria. Try lowering the match threshold.")
 
-    st.markdown("---")
 
-    # Detailed Job Analysis
-    st.subheader("📊 Detailed Analysis & Visualizations")
+# Learning-path priority -> marker; anything else is shown as low priority
+PRIORITY_MARKERS = {"Critical": "🔴", "High": "🟡"}
 
-    if matches:
-        # Create tabs for different analyses
-        tab1, tab2, tab3 = st.tabs(["Match Scores", "Skill Gaps", "Opportunity Analysis"])
 
-        with tab1:
-            st.markdown("#### Match Score Gauges")
-            # Show gauges for top 3-5 jobs
-            cols = st.columns(min(3, len(matches[:3])))
-            for idx, (col, match) in enumerate(zip(cols, matches[:3])):
-                with col:
-                    from src.visualization import create_match_score_gauge
-                    fig_gauge = create_match_score_gauge(match.match_score, match.job_title)
-                    st.plotly_chart(fig_gauge, use_container_width=True)
+@st.fragment
+def render_gap_analysis(match_key: tuple, skills, matches):
+    """Render the skill gap tab; a fragment, so picking a role reruns only this block"""
+    # Gap Analysis Charts
+    st.markdown("#### Skills Gap Analysis")
 
-        with tab2:
-            # Gap Analysis Charts
-            st.markdown("#### Skills Gap Analysis")
+    titles = match_titles(match_key, matches)
+    target_job = st.selectbox(
+        "Select a role for detailed gap analysis:",
+        titles,
+        key="gap_analysis_job"
+    )
 
-            target_job = st.selectbox(
-                "Select a role for detailed gap analysis:",
-                [match.job_title for match in matches[:10]],
-                key="gap_analysis_job"
+    if target_job:
+        target_match = match_index(match_key, matches)[target_job]
+
+        gap_analysis = find_skill_gaps(match_key, skills, target_job)
+
+        if 'error' not in gap_analysis:
+            # Show readiness gauge
+            col_gauge, col_info = st.columns([1, 1.5])
+
+            with col_gauge:
+                fig_readiness = create_profile_completeness_gauge(gap_analysis.get('readiness_score', 0))
+                st.plotly_chart(fig_readiness, use_container_width=True, key="gap_readiness_gauge")
+
+            with col_info:
+                st.markdown("#### Readiness Summary")
+                readiness = gap_analysis.get('readiness_score', 0)
+                if readiness >= 0.8:
+                    st.success(f"Excellent readiness: {readiness*100:.0f}%")
+                elif readiness >= 0.6:
+                    st.info(f"Good readiness: {readiness*100:.0f}%")
+                elif readiness >= 0.4:
+                    st.warning(f"Fair readiness: {readiness*100:.0f}%")
+                else:
+                    st.error(f"Development needed: {readiness*100:.0f}%")
+
+            # Gap visualization
+            col_waterfall, col_comparison = st.columns(2)
+
+            with col_waterfall:
+                fig_waterfall = create_skills_gap_waterfall(
+                    matched=len(target_match.matched_skills),
+                    required=len(target_match.matched_skills) + len(target_match.missing_required),
+                    preferred=len(target_match.missing_preferred)
+                )
+                st.plotly_chart(fig_waterfall, use_container_width=True, key="gap_waterfall")
+
+            with col_comparison:
+                matched_set = set(target_match.matched_skills)
+                missing_preferred_set = set(target_match.missing_preferred)
+                fig_req_pref = create_required_vs_preferred(
+                    matched_required=len(matched_set - missing_preferred_set),
+                    total_required=len(target_match.matched_skills) + len(target_match.missing_required),
+                    matched_preferred=len(matched_set & missing_preferred_set),
+                    total_preferred=len(target_match.missing_preferred)
+                )
+                st.plotly_chart(fig_req_pref, use_container_width=True, key="gap_required_vs_preferred")
+
+            # Skill gaps breakdown
+            st.markdown("#### Skills to Develop")
+
+            gap_cols = st.columns(2)
+
+            with gap_cols[0]:
+                if gap_analysis.get('gaps', {}).get('critical'):
+                    st.warning("**🔴 Critical Skills (Must Have):**")
+                    st.markdown("\n".join(f"- {skill}" for skill in islice(gap_analysis['gaps']['critical'], 5)))
+
+            with gap_cols[1]:
+                if gap_analysis.get('gaps', {}).get('preferred'):
+                    st.info("**🟡 Preferred Skills (Nice to Have):**")
+                    st.markdown("\n".join(f"- {skill}" for skill in islice(gap_analysis['gaps']['preferred'], 5)))
+
+            # Learning recommendations
+            if gap_analysis.get('recommendations'):
+                st.markdown("#### Learning Path")
+                st.success("**📚 Recommended Learning Sequence:**")
+                steps = []
+                for i, rec in enumerate(islice(gap_analysis['recommendations'], 5), 1):
+                    priority = rec.get('priority', 'Medium')
+                    action = rec.get('action', '')
+                    color = PRIORITY_MARKERS.get(priority, "🟢")
+                    steps.append(f"{i}. {color} [{priority}] {action}")
+                st.markdown("\n".join(steps))
+
+
+# Evidence relevance bands: similarity below 0.5 is Low, below 0.8 Medium, else High
+RELEVANCE_THRESHOLDS = (0.5, 0.8)
+RELEVANCE_LEVELS = (("#EF4444", "Low"), ("#F59E0B", "Medium"), ("#10B981", "High"))
+
+# Evidence card markup; the .ev-* styles live in static/app.css
+EVIDENCE_CARD_TEMPLATE = (
+    '<div class="ev-card" style="--ev-color: {color}; --ev-tint: {color}20;">'
+    '<div class="ev-card-header">'
+    '<div class="ev-card-title">[{index}] {source_type}</div>'
+    '<div class="ev-relevance">{relevance_label} Relevance</div>'
+    '</div>'
+    '<div class="ev-text">{text}</div>'
+    '<div class="ev-meta"><div>📊 Relevance: <strong>{similarity:.2%}</strong></div></div>'
+    '{skill_html}'
+    '</div>'
+)
+EVIDENCE_SKILL_TEMPLATE = '<div class="ev-skill">🎯 Skill: {skill_name} | Confidence: {confidence:.2%}</div>'
+
+
+def render_evidence(sources: list, show_source_analysis: bool, chart_key: str, expanded: bool = False):
+    """
+    Render the evidence expander for one assistant answer
+
+    Args:
+        sources: Retrieved sources returned by RAGSystem.query
+        show_source_analysis: Whether to include the source relevance chart
+        chart_key: Stable st.plotly_chart key for this answer's chart
+        expanded: Whether the expander starts open; the chart of a collapsed
+            (older) answer is only built once the user asks for it
+    """
+    with st.expander("📚 View Evidence & Sources", expanded=expanded):
+        # Source relevance analysis chart
+        if show_source_analysis and len(sources) > 0 and (
+            expanded or st.toggle("📊 Show source relevance chart", key=f"{chart_key}_toggle")
+        ):
+            st.subheader("📊 Source Relevance Analysis")
+
+            fig_sources = create_source_relevance_chart(
+                tuple(src['type_label'] for src in sources),
+                tuple(round(src.get('similarity', 0), 4) for src in sources),
             )
+            st.plotly_chart(fig_sources, use_container_width=True, key=chart_key)
+            st.divider()
+
+        # Detailed evidence cards
+        st.subheader("💡 Evidence Details")
+        cards = []
+        for i, src in enumerate(sources, 1):
+            similarity_score = src.get('similarity', 0)
+            color_hex, relevance_label = RELEVANCE_LEVELS[bisect_right(RELEVANCE_THRESHOLDS, similarity_score)]
+
+            skill_html = ""
+            if src.get('skill_name'):
+                skill_html = EVIDENCE_SKILL_TEMPLATE.format(
+                    skill_name=src['skill_name'], confidence=src.get('confidence', 0)
+                )
 
-            if target_job:
-                target_match = next((m for m in matches if m.job_title == target_job), None)
-
-                if target_match:
-                    gap_analysis = matcher.identify_skill_gaps(profile.skills, target_job)
-
-                    if 'error' not in gap_analysis:
-                        # Show readiness gauge
-                        col_gauge, col_info = st.columns([1, 1.5])
-
-                        with col_gauge:
-                            from src.visualization import create_profile_completeness_gauge
-                            fig_readiness = create_profile_completeness_gauge(gap_analysis.get('readiness_score', 0))
-                            st.plotly_chart(fig_readiness, use_container_width=True)
-
-                        with col_info:
-                            st.markdown("#### Readiness Summary")
-                            readiness = gap_analysis.get('readiness_score', 0)
-                            if readiness >= 0.8:
-                                st.success(f"Excellent readiness: {readiness*100:.0f}%")
-                            elif readiness >= 0.6:
-                                st.info(f"Good readiness: {readiness*100:.0f}%")
-                            elif readiness >= 0.4:
-                                st.warning(f"Fair readiness: {readiness*100:.0f}%")
-                            else:
-                                st.error(f"Development needed: {readiness*100:.0f}%")
-
-                        # Gap visualization
-                        col_waterfall, col_comparison = st.columns(2)
-
-                        with col_waterfall:
-                            from src.visualization import create_skills_gap_waterfall
-                            fig_waterfall = create_skills_gap_waterfall(
-                                matched=len(target_match.matched_skills),
-                                required=len(target_match.matched_skills) + len(target_match.missing_required),
-                                preferred=len(target_match.missing_preferred)
-                            )
-                            st.plotly_chart(fig_waterfall, use_container_width=True)
-
-                        with col_comparison:
-                            from src.visualization import create_required_vs_preferred
-                            fig_req_pref = create_required_vs_preferred(
-                                matched_required=len([s for s in target_match.matched_skills if s not in target_match.missing_preferred]),
-                                total_required=len(target_match.matched_skills) + len(target_match.missing_required),
-                                matched_preferred=len([s for s in target_match.matched_skills if s in target_match.missing_preferred]),
-                                total_preferred=len(target_match.missing_preferred)
-                            )
-                            st.plotly_chart(fig_req_pref, use_container_width=True)
-
-                        # Skill gaps breakdown
-                        st.markdown("#### Skills to Develop")
-
-                        gap_cols = st.columns(2)
-
-                        with gap_cols[0]:
-                            if gap_analysis.get('gaps', {}).get('critical'):
-                                st.warning("**🔴 Critical Skills (Must Have):**")
-                                for skill in gap_analysis['gaps']['critical'][:5]:
-                                    st.write(f"- {skill}")
-
-                        with gap_cols[1]:
-                            if gap_analysis.get('gaps', {}).get('preferred'):
-                                st.info("**🟡 Preferred Skills (Nice to Have):**")
-                                for skill in gap_analysis['gaps']['preferred'][:5]:
-                                    st.write(f"- {skill}")
-
-                        # Learning recommendations
-                        if gap_analysis.get('recommendations'):
-                            st.markdown("#### Learning Path")
-                            st.success("**📚 Recommended Learning Sequence:**")
-                            for i, rec in enumerate(gap_analysis['recommendations'][:5], 1):
-                                priority = rec.get('priority', 'Medium')
-                                action = rec.get('action', '')
-                                color = "🔴" if priority == "Critical" else "🟡" if priority == "High" else "🟢"
-                                st.write(f"{i}. {color} [{priority}] {action}")
-
-        with tab3:
-            st.markdown("#### Opportunity Analysis")
-
-            # Show comparison across multiple jobs
-            if len(matches) > 1:
-                from src.visualization import create_skills_portfolio_bubble
-
-                # Prepare data for bubble chart
-                category_data = {}
-                for match in matches[:6]:
-                    category_data[match.job_title[:20]] = (
-                        match.match_score,
-                        len(match.matched_skills)
-                    )
-
-                if category_data:
-                    fig_bubble = create_skills_portfolio_bubble(category_data)
-                    st.plotly_chart(fig_bubble, use_container_width=True)
-
-            # Summary statistics
-            st.markdown("#### Career Path Statistics")
-
-            stat_cols = st.columns(3)
-
-            with stat_cols[0]:
-                st.metric("Total Opportunities", len(matches))
-
-            with stat_cols[1]:
-                avg_gap = sum(len(m.missing_required) + len(m.missing_preferred) for m in matches) / len(matches) if matches else 0
-                st.metric("Avg Skills to Develop", f"{avg_gap:.1f}")
-
-            with stat_cols[2]:
-                total_unique_gaps = len(set(
-                    skill
-                    for match in matches
-                    for skill in match.missing_required + match.missing_preferred
-                ))
-                st.metric("Unique Skills Needed", total_unique_gaps)
-
-
-def create_radar_chart(skills):
-    """Create radar chart for top skills"""
-    skill_names = [s.skill_name[:20] for s in skills]  # Truncate long names
-    confidences = [s.final_confidence for s in skills]
-
-    fig = go.Figure()
-
-    fig.add_trace(go.Scatterpolar(
-        r=confidences,
-        theta=skill_names,
-        fill='toself',
-        name='Confidence Level'
-    ))
-
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, 1]
-            )
-        ),
-        showlegend=False,
-        title="Top Skills Confidence Radar"
-    )
+            cards.append(EVIDENCE_CARD_TEMPLATE.format_map({
+                'index': i,
+                'source_type': src['type_label'],
+                'color': color_hex,
+                'relevance_label': relevance_label,
+                'text': src['text'],
+                'similarity': similarity_score,
+                'skill_html': skill_html,
+            }))
 
-    return fig
+        # One markdown element for every card; spacing comes from each card's margin
+        st.markdown("".join(cards), unsafe_allow_html=True)
 
 
 def render_employer_qa_page():
@@ -833,12 +1030,10 @@ def render_employer_qa_page():
     st.markdown("Ask natural language questions about the candidate's skills, experience, and qualifications")
 
     # Display candidate overview cards at top
-    from src.visualization import create_info_card, create_metric_grid
-
     profile = st.session_state.profile
 
     # Quick overview metrics
-    high_confidence_skills = len([s for s in profile.skills if s.final_confidence >= 0.75])
+    high_confidence_skills = profile.level_counts['high']
 
     metrics = [
         {"label": "Candidate Name", "value": profile.name or "Unknown", "icon": "👤", "color": "primary"},
@@ -849,7 +1044,7 @@ def render_employer_qa_page():
 
     create_metric_grid(metrics, columns=4)
 
-    st.markdown("---")
+    st.divider()
 
     # Sidebar settings
     with st.sidebar:
@@ -879,9 +1074,9 @@ def render_employer_qa_page():
 
         # Profile info
         st.subheader("📊 Candidate Info")
-        st.write(f"**Name:** {st.session_state.profile.name or 'Unknown'}")
-        st.metric("Total Skills", len(st.session_state.profile.skills))
-        st.metric("Data Sources", len(st.session_state.profile.data_sources))
+        st.write(f"**Name:** {profile.name or 'Unknown'}")
+        st.metric("Total Skills", len(profile.skills))
+        st.metric("Data Sources", len(profile.data_sources))
 
         # Reset conversation button
         if st.button("🔄 Reset Conversation"):
@@ -891,16 +1086,24 @@ def render_employer_qa_page():
                 st.session_state.chat_messages = []
             st.rerun()
 
-    # Initialize RAG system
-    if 'rag_system' not in st.session_state or st.session_state.get('rag_provider') != llm_provider:
+    # Initialize RAG system: index once per profile, a provider switch only swaps the LLM client
+    rag_key = profile_key(profile)
+    needs_index = 'rag_system' not in st.session_state or st.session_state.get('rag_profile_key') != rag_key
+    if needs_index or st.session_state.get('rag_provider') != llm_provider:
         with st.spinner(f"🔍 Initializing RAG system with {llm_provider}..."):
             try:
                 api_key = api_key_input if api_key_input else None
-                st.session_state.rag_system = RAGSystem(
-                    st.session_state.profile,
-                    llm_provider=llm_provider,
-                    api_key=api_key
-                )
+                if needs_index:
+                    # Imported lazily: pulls in FAISS, sentence-transformers and the LLM clients
+                    from rag.rag_system import RAGSystem
+                    st.session_state.rag_system = RAGSystem(
+                        profile,
+                        llm_provider=llm_provider,
+                        api_key=api_key
+                    )
+                    st.session_state.rag_profile_key = rag_key
+                else:
+                    st.session_state.rag_system.set_llm(llm_provider, api_key)
                 st.session_state.rag_provider = llm_provider
                 # Clear chat history when switching providers
                 st.session_state.chat_messages = []
@@ -910,133 +1113,33 @@ def render_employer_qa_page():
                 st.info("💡 Tip: For Gemini, you may not need an API key. For OpenAI/Anthropic, enter your API key in the sidebar.")
                 return
 
-    # Initialize chat history
-    if 'chat_messages' not in st.session_state:
-        st.session_state.chat_messages = []
+    render_qa_chat(show_evidence, show_source_analysis)
+
 
-    # Display chat history
-    for msg in st.session_state.chat_messages:
+@st.fragment
+def render_qa_chat(show_evidence: bool, show_source_analysis: bool):
+    """Render chat history, input and quick questions; a fragment, so asking a question reruns only the chat"""
+    # Initialize chat history; bound locally along with the RAG system for this run
+    chat_messages = st.session_state.setdefault('chat_messages', [])
+    rag_system = st.session_state.rag_system
+
+    # Display chat history, with the latest answer's evidence opened
+    last_idx = len(chat_messages) - 1
+    for msg_idx, msg in enumerate(chat_messages):
         with st.chat_message(msg["role"]):
             st.markdown(msg["content"])
 
             # Show enhanced evidence if available and enabled
             if show_evidence and msg.get("sources") and msg["role"] == "assistant":
-                with st.expander("📚 View Evidence & Sources"):
-                    sources = msg["sources"]
-
-                    # Source relevance analysis chart
-                    if show_source_analysis and len(sources) > 0:
-                        st.subheader("📊 Source Relevance Analysis")
-
-                        import plotly.graph_objects as go
-                        source_types = [src['type'].replace('_', ' ').title() for src in sources]
-                        similarities = [src.get('similarity', 0) for src in sources]
-
-                        fig_sources = go.Figure(
-                            data=[
-                                go.Bar(
-                                    y=source_types,
-                                    x=similarities,
-                                    orientation='h',
-                                    marker=dict(
-                                        color=similarities,
-                                        colorscale='RdYlGn',
-                                        cmin=0,
-                                        cmax=1,
-                                        showscale=True,
-                                        colorbar=dict(title="Relevance")
-                                    ),
-                                    text=[f"{sim:.2f}" for sim in similarities],
-                                    textposition='outside',
-                                    hovertemplate="<b>%{y}</b><br>Relevance: %{x:.2f}<extra></extra>"
-                                )
-                            ]
-                        )
-
-                        fig_sources.update_layout(
-                            title="Evidence Source Relevance Scores",
-                            xaxis_title="Relevance Score",
-                            yaxis_title="Source Type",
-                            height=250,
-                            margin=dict(l=150, r=50, t=80, b=50),
-                            template="plotly_white"
-                        )
-
-                        st.plotly_chart(fig_sources, use_container_width=True)
-                        st.markdown("---")
-
-                    # Detailed evidence cards
-                    st.subheader("💡 Evidence Details")
-                    for i, src in enumerate(sources, 1):
-                        source_type = src['type'].replace('_', ' ').title()
-                        similarity_score = src.get('similarity', 0)
-
-                        if similarity_score >= 0.8:
-                            color_hex = "#10B981"
-                            relevance_label = "High"
-                        elif similarity_score >= 0.5:
-                            color_hex = "#F59E0B"
-                            relevance_label = "Medium"
-                        else:
-                            color_hex = "#EF4444"
-                            relevance_label = "Low"
-
-                        source_card = f"""
-                        <div style="
-                            padding: 1.5rem;
-                            border-radius: 12px;
-                            background: white;
-                            border-left: 4px solid {color_hex};
-                            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05);
-                            border: 1px solid #E5E7EB;
-                            margin-bottom: 1rem;
-                        ">
-                            <div style="display: flex; justify-content: space-between; align-items: start; margin-bottom: 0.75rem;">
-                                <div style="font-weight: 700; color: #0F172A; font-size: 1.125rem;">
-                                    [{i}] {source_type}
-                                </div>
-                                <div style="
-                                    display: inline-block;
-                                    padding: 0.25rem 0.75rem;
-                                    background-color: {color_hex}20;
-                                    border-radius: 20px;
-                                    color: {color_hex};
-                                    font-weight: 600;
-                                    font-size: 0.875rem;
-                                ">
-                                    {relevance_label} Relevance
-                                </div>
-                            </div>
-
-                            <div style="
-                                padding: 1rem;
-                                background-color: #F9FAFB;
-                                border-radius: 8px;
-                                color: #374151;
-                                font-size: 0.95rem;
-                                line-height: 1.6;
-                                margin-bottom: 0.75rem;
-                            ">
-                                {src['text']}
-                            </div>
-
-                            <div style="display: flex; gap: 1rem; font-size: 0.875rem; color: #6B7280;">
-                                <div>📊 Relevance: <strong style="color: {color_hex};">{similarity_score:.2%}</strong></div>
-                        </div>
-                        </div>
-                        """
-
-                        st.markdown(source_card, unsafe_allow_html=True)
-
-                        if src.get('skill_name'):
-                            st.caption(f"🎯 Skill: {src['skill_name']} | Confidence: {src.get('confidence', 0):.2%}")
-
-                        st.markdown("")
+                render_evidence(
+                    msg["sources"], show_source_analysis,
+                    chart_key=f"source_relevance_{msg_idx}", expanded=msg_idx == last_idx
+                )
 
     # Chat input
     if prompt := st.chat_input("Ask about this candidate... (e.g., 'Does this candidate have Python experience?')"):
         # Add user message
-        st.session_state.chat_messages.append({"role": "user", "content": prompt})
+        chat_messages.append({"role": "user", "content": prompt})
 
         # Display user message
         with st.chat_message("user"):
@@ -1046,148 +1149,32 @@ def render_employer_qa_page():
         with st.chat_message("assistant"):
             with st.spinner("Analyzing profile..."):
                 try:
-                    answer, sources = st.session_state.rag_system.query(prompt)
+                    answer, sources = rag_system.query(prompt)
 
                     # Display answer
                     st.markdown(answer)
 
-                    # Add to chat history
-                    st.session_state.chat_messages.append({
+                    # Add to chat history; its evidence and chart render from the history
+                    # replay on the rerun below, so the answer itself shows up first
+                    chat_messages.append({
                         "role": "assistant",
                         "content": answer,
                         "sources": sources
                     })
 
-                    # Show evidence with visualizations
-                    if show_evidence and sources:
-                        with st.expander("📚 View Evidence & Sources", expanded=True):
-                            # Source relevance analysis chart
-                            if show_source_analysis and len(sources) > 0:
-                                st.subheader("📊 Source Relevance Analysis")
-
-                                # Create source relevance visualization
-                                import plotly.graph_objects as go
-                                source_types = [src['type'].replace('_', ' ').title() for src in sources]
-                                similarities = [src.get('similarity', 0) for src in sources]
-
-                                fig_sources = go.Figure(
-                                    data=[
-                                        go.Bar(
-                                            y=source_types,
-                                            x=similarities,
-                                            orientation='h',
-                                            marker=dict(
-                                                color=similarities,
-                                                colorscale='RdYlGn',
-                                                cmin=0,
-                                                cmax=1,
-                                                showscale=True,
-                                                colorbar=dict(title="Relevance")
-                                            ),
-                                            text=[f"{sim:.2f}" for sim in similarities],
-                                            textposition='outside',
-                                            hovertemplate="<b>%{y}</b><br>Relevance: %{x:.2f}<extra></extra>"
-                                        )
-                                    ]
-                                )
-
-                                fig_sources.update_layout(
-                                    title="Evidence Source Relevance Scores",
-                                    xaxis_title="Relevance Score",
-                                    yaxis_title="Source Type",
-                                    height=250,
-                                    margin=dict(l=150, r=50, t=80, b=50),
-                                    template="plotly_white"
-                                )
-
-                                st.plotly_chart(fig_sources, use_container_width=True)
-
-                            st.markdown("---")
-
-                            # Detailed evidence cards
-                            st.subheader("💡 Evidence Details")
-                            for i, src in enumerate(sources, 1):
-                                # Create color-coded source card
-                                source_type = src['type'].replace('_', ' ').title()
-                                similarity_score = src.get('similarity', 0)
-
-                                # Determine color based on similarity
-                                if similarity_score >= 0.8:
-                                    color_hex = "#10B981"  # Green
-                                    relevance_label = "High"
-                                elif similarity_score >= 0.5:
-                                    color_hex = "#F59E0B"  # Amber
-                                    relevance_label = "Medium"
-                                else:
-                                    color_hex = "#EF4444"  # Red
-                                    relevance_label = "Low"
-
-                                source_card = f"""
-                                <div style="
-                                    padding: 1.5rem;
-                                    border-radius: 12px;
-                                    background: white;
-                                    border-left: 4px solid {color_hex};
-                                    box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05);
-                                    border: 1px solid #E5E7EB;
-                                    margin-bottom: 1rem;
-                                ">
-                                    <div style="display: flex; justify-content: space-between; align-items: start; margin-bottom: 0.75rem;">
-                                        <div style="font-weight: 700; color: #0F172A; font-size: 1.125rem;">
-                                            [{i}] {source_type}
-                                        </div>
-                                        <div style="
-                                            display: inline-block;
-                                            padding: 0.25rem 0.75rem;
-                                            background-color: {color_hex}20;
-                                            border-radius: 20px;
-                                            color: {color_hex};
-                                            font-weight: 600;
-                                            font-size: 0.875rem;
-                                        ">
-                                            {relevance_label} Relevance
-                                        </div>
-                                    </div>
-
-                                    <div style="
-                                        padding: 1rem;
-                                        background-color: #F9FAFB;
-                                        border-radius: 8px;
-                                        color: #374151;
-                                        font-size: 0.95rem;
-                                        line-height: 1.6;
-                                        margin-bottom: 0.75rem;
-                                    ">
-                                        {src['text']}
-                                    </div>
-
-                                    <div style="display: flex; gap: 1rem; font-size: 0.875rem; color: #6B7280;">
-                                        <div>📊 Relevance: <strong style="color: {color_hex};">{similarity_score:.2%}</strong></div>
-                                </div>
-                                </div>
-                                """
-
-                                st.markdown(source_card, unsafe_allow_html=True)
-
-                                # Additional metadata
-                                if src.get('skill_name'):
-                                    st.caption(f"🎯 Skill: {src['skill_name']} | Confidence: {src.get('confidence', 0):.2%}")
-
-                                st.markdown("")  # Spacing
-
                 except Exception as e:
                     error_msg = f"❌ Error: {str(e)}"
                     st.error(error_msg)
-                    st.session_state.chat_messages.append({
+                    chat_messages.append({
                         "role": "assistant",
                         "content": error_msg,
                         "sources": []
                     })
 
-        st.rerun()
+        st.rerun(scope="fragment")
 
     # Quick question templates
-    if len(st.session_state.chat_messages) == 0:
+    if len(chat_messages) == 0:
         st.divider()
         st.subheader("💡 Quick Question Templates")
         st.markdown("Click a question to ask it:")
@@ -1195,13 +1182,14 @@ def render_employer_qa_page():
         # Create tabs for question categories
         tabs = st.tabs(list(QUICK_QUESTIONS.keys()))
 
-        for tab, (category, questions) in zip(tabs, QUICK_QUESTIONS.items()):
+        for cat_idx, (tab, questions) in enumerate(zip(tabs, QUICK_QUESTIONS.values())):
             with tab:
-                for question in questions:
-                    if st.button(question, key=f"quick_{category}_{question[:20]}"):
+                # Position-based keys: short, stable and unique even when questions share a prefix
+                for q_idx, question in enumerate(questions):
+                    if st.button(question, key=f"quick_{cat_idx}_{q_idx}"):
                         # Trigger query
                         st.session_state.pending_query = question
-                        st.rerun()
+                        st.rerun(scope="fragment")
 
         # Handle pending query
         if 'pending_query' in st.session_state:
@@ -1209,24 +1197,76 @@ def render_employer_qa_page():
             del st.session_state.pending_query
 
             # Add to chat and process
-            st.session_state.chat_messages.append({"role": "user", "content": query})
+            chat_messages.append({"role": "user", "content": query})
 
             with st.spinner("Analyzing profile..."):
                 try:
-                    answer, sources = st.session_state.rag_system.query(query)
-                    st.session_state.chat_messages.append({
+                    answer, sources = rag_system.query(query)
+                    chat_messages.append({
                         "role": "assistant",
                         "content": answer,
                         "sources": sources
                     })
                 except Exception as e:
-                    st.session_state.chat_messages.append({
+                    chat_messages.append({
                         "role": "assistant",
                         "content": f"Error: {str(e)}",
                         "sources": []
                     })
 
-            st.rerun()
+            st.rerun(scope="fragment")
+
+
+def profile_key(profile) -> str:
+    """Unique identity of a built profile, used to key per-profile caches"""
+    return profile.metadata['profile_id']
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def export_profile_json(key: str, _profile) -> bytes:
+    """Serialize the profile export once per profile, pre-encoded to bytes"""
+    profile_json = {
+        'name': _profile.name,
+        'summary': _profile.summary,
+        'total_skills': len(_profile.skills),
+        'top_skills': [
+            {
+                'skill': s.skill_name,
+                'confidence': s.final_confidence,
+                'category': s.category
+            }
+            for s in _profile.top_skills
+        ],
+        'metadata': _profile.metadata
+    }
+
+    if orjson is not None:
+        return orjson.dumps(profile_json, option=orjson.OPT_INDENT_2)
+    return json.dumps(profile_json, indent=2).encode('utf-8')
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def export_profile_summary(key: str, _profile) -> str:
+    """Build the plain-text profile summary once per profile"""
+    top_skills_text = "\n".join(
+        f"{i}. {s.skill_name} (Confidence: {s.final_confidence:.2f})"
+        for i, s in enumerate(islice(_profile.top_skills, 10), 1)
+    )
+
+    return f"""
+SkillSense Profile Summary
+{'=' * 50}
+
+Name: {_profile.name or 'Unknown'}
+Generated: {_profile.metadata['created_at']}
+
+{_profile.summary}
+
+Top 10 Skills:
+{top_skills_text}
+
+Data Sources: {', '.join(_profile.data_sources)}
+        """
 
 
 def render_export_page():
@@ -1243,53 +1283,56 @@ def render_export_page():
 
     with col1:
         st.subheader("JSON Export")
-        profile_json = {
-            'name': profile.name,
-            'summary': profile.summary,
-            'total_skills': len(profile.skills),
-            'top_skills': [
-                {
-                    'skill': s.skill_name,
-                    'confidence': s.final_confidence,
-                    'category': s.category
-                }
-                for s in profile.top_skills
-            ],
-            'metadata': profile.metadata
-        }
-
         st.download_button(
             label="📥 Download Profile (JSON)",
-            data=json.dumps(profile_json, indent=2),
+            data=export_profile_json(profile_key(profile), profile),
             file_name="skillsense_profile.json",
             mime="application/json"
         )
 
     with col2:
         st.subheader("Text Summary")
-        summary_text = f"""
-SkillSense Profile Summary
-{'=' * 50}
-
-Name: {profile.name or 'Unknown'}
-Generated: {profile.metadata['created_at']}
-
-{profile.summary}
-
-Top 10 Skills:
-{chr(10).join([f"{i}. {s.skill_name} (Confidence: {s.final_confidence:.2f})" for i, s in enumerate(profile.top_skills[:10], 1)])}
-
-Data Sources: {', '.join(profile.data_sources)}
-        """
-
         st.download_button(
             label="📥 Download Summary (TXT)",
-            data=summary_text,
+            data=export_profile_summary(profile_key(profile), profile),
             file_name="skillsense_summary.txt",
             mime="text/plain"
         )
 
 
+DASHBOARD_SKILL_ROW_TEMPLATE = (
+    '<div style="padding: 1rem; margin-bottom: 0.75rem; border-radius: 8px; background: white; border: 1px solid #E5E7EB;">'
+    '<div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.5rem;">'
+    '<div style="font-weight: 700; color: #0F172A;">{idx}. {name}</div>'
+    '<div style="font-size: 0.875rem; color: {color}; font-weight: 700;">{pct}</div>'
+    '</div>'
+    '<div style="width: 100%; height: 8px; background-color: #E5E7EB; border-radius: 4px; overflow: hidden;">'
+    '<div style="height: 100%; width: {width}%; background-color: {color}; border-radius: 4px;"></div>'
+    '</div>'
+    '</div>'
+)
+
+
+RECOMMENDATION_TEMPLATE = '<div class="rec-card">✨ {text}</div>'
+DASHBOARD_RECOMMENDATIONS = (
+    ("expand", "📌 <strong>Expand Your Skills</strong>: You have identified several skills. Consider adding more sources (references, projects) to discover additional competencies."),
+    ("validate", "📌 <strong>Validate Your Skills</strong>: You have many skills with medium or low confidence. Add more evidence from your CV or work samples to strengthen these."),
+    ("diversify", "📌 <strong>Diversify Your Sources</strong>: Adding a GitHub profile, personal statement, or references will provide a more comprehensive skill picture."),
+    ("review", "📌 <strong>Review Your Profile</strong>: Visit the <strong>🎓 Skill Profile</strong> page to see detailed skill breakdown and evidence."),
+    ("explore", "📌 <strong>Explore Job Matches</strong>: Head to <strong>💼 Job Matching</strong> to discover opportunities that align with your skills."),
+)
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def dashboard_top_skills(key: str, _profile) -> tuple:
+    """Top 10 skills as (name, percent label, bar width, color) rows, formatted once per profile"""
+    rows = []
+    for s in _profile.top_skills_by_confidence(10):
+        confidence = s.final_confidence
+        rows.append((s.skill_name, f"{confidence:.0%}", f"{confidence * 100:.2f}", get_confidence_color(confidence)))
+    return tuple(rows)
+
+
 def render_dashboard_page():
     """Render executive dashboard with career readiness summary"""
     if st.session_state.profile is None:
@@ -1301,121 +1344,127 @@ def render_dashboard_page():
     st.markdown("Your career readiness and top skills summary")
 
     # Header metrics
-    from src.visualization import create_metric_grid, create_info_card
-
     total_skills = len(profile.skills)
-    high_conf = len([s for s in profile.skills if s.final_confidence >= 0.75])
-    med_conf = len([s for s in profile.skills if 0.5 <= s.final_confidence < 0.75])
-    low_conf = len([s for s in profile.skills if s.final_confidence < 0.5])
+    if total_skills == 0:
+        st.info("No skills identified yet. Add more data in **📊 Data Input** to see your Career Readiness Summary.")
+        return
+
+    high_conf = profile.level_counts['high']
+    med_conf = profile.level_counts['medium']
+    low_conf = profile.level_counts['low']
 
     # Overall profile completeness
     profile_completeness = min((total_skills / 50), 1.0)  # Assume 50 skills is 100%
+    completeness_pct = int(profile_completeness * 100)
+    avg_conf_label = f"{profile.average_confidence:.0%}"
 
     metrics = [
-        {"label": "Profile Completeness", "value": f"{int(profile_completeness * 100)}%", "icon": "📊", "color": "secondary"},
+        {"label": "Profile Completeness", "value": f"{completeness_pct}%", "icon": "📊", "color": "secondary"},
         {"label": "Total Skills Identified", "value": total_skills, "icon": "🎯", "color": "primary"},
         {"label": "High Confidence", "value": high_conf, "icon": "⭐", "color": "success"},
-        {"label": "Avg Confidence", "value": f"{sum(s.final_confidence for s in profile.skills) / total_skills if total_skills > 0 else 0:.0%}", "icon": "📈", "color": "secondary"},
+        {"label": "Avg Confidence", "value": avg_conf_label, "icon": "📈", "color": "secondary"},
     ]
 
     create_metric_grid(metrics, columns=4)
 
-    st.markdown("---")
+    st.divider()
 
     st.subheader("📋 Career Readiness Summary")
 
-    # Create summary cards
-    col1, col2 = st.columns(2)
-
-    with col1:
-        create_info_card(
-            title="Skill Strength",
-            content=f"You have identified <strong>{total_skills} unique skills</strong> with an average confidence of <strong>{sum(s.final_confidence for s in profile.skills) / total_skills if total_skills > 0 else 0:.0%}</strong>. "
-            f"<strong>{high_conf}</strong> skills have high confidence scores (75%+).",
-            color="success",
-            icon="💪"
-        )
-
-    with col2:
-        create_info_card(
-            title="Profile Coverage",
-            content=f"Your profile is <strong>{int(profile_completeness * 100)}% complete</strong>. "
-            f"You have provided <strong>{len(profile.data_sources)} data sources</strong>, which helps ensure comprehensive skill extraction.",
-            color="secondary",
-            icon="📚"
-        )
+    # Both summary cards in one two-column grid element
+    strength_card = create_info_card_html(
+        title="Skill Strength",
+        content=f"You have identified <strong>{total_skills} unique skills</strong> with an average confidence of <strong>{avg_conf_label}</strong>. "
+        f"<strong>{high_conf}</strong> skills have high confidence scores (75%+).",
+        color="success",
+        icon="💪"
+    )
+    coverage_card = create_info_card_html(
+        title="Profile Coverage",
+        content=f"Your profile is <strong>{completeness_pct}% complete</strong>. "
+        f"You have provided <strong>{len(profile.data_sources)} data sources</strong>, which helps ensure comprehensive skill extraction.",
+        color="secondary",
+        icon="📚"
+    )
+    st.markdown(f'<div class="info-card-grid">{strength_card}{coverage_card}</div>', unsafe_allow_html=True)
 
-    st.markdown("---")
+    st.divider()
 
     # Top skills section
     st.subheader("⭐ Top 10 Skills by Confidence")
 
-    top_skills = sorted(profile.skills, key=lambda s: s.final_confidence, reverse=True)[:10]
-
-    for idx, skill in enumerate(top_skills, 1):
-        from src.visualization import get_confidence_color
-
-        # Create a custom progress bar for each skill
-        conf = skill.final_confidence
-        color = get_confidence_color(conf) if hasattr(skill, 'final_confidence') else "#3B82F6"
-        skill_name = skill.skill_name if hasattr(skill, 'skill_name') else getattr(skill, 'name', 'Unknown')
-
-        skill_row = f"""
-        <div style="
-            padding: 1rem;
-            margin-bottom: 0.75rem;
-            border-radius: 8px;
-            background: white;
-            border: 1px solid #E5E7EB;
-        ">
-            <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.5rem;">
-                <div style="font-weight: 700; color: #0F172A;">
-                    {idx}. {skill_name}
-                </div>
-                <div style="font-size: 0.875rem; color: {color}; font-weight: 700;">
-                    {skill.final_confidence:.0%}
-                </div>
-            </div>
-            <div style="
-                width: 100%;
-                height: 8px;
-                background-color: #E5E7EB;
-                border-radius: 4px;
-                overflow: hidden;
-            ">
-                <div style="
-                    height: 100%;
-                    width: {skill.final_confidence * 100}%;
-                    background-color: {color};
-                    border-radius: 4px;
-                "></div>
-            </div>
-        </div>
-        """
-        st.markdown(skill_row, unsafe_allow_html=True)
+    top_skills = dashboard_top_skills(profile_key(profile), profile)
+
+    skill_rows = "".join(
+        DASHBOARD_SKILL_ROW_TEMPLATE.format(
+            idx=idx, name=skill_name, color=color, pct=pct, width=width
+        )
+        for idx, (skill_name, pct, width, color) in enumerate(top_skills, 1)
+    )
+
+    # One markdown element for all ten rows instead of one per skill
+    st.markdown(skill_rows, unsafe_allow_html=True)
 
-    st.markdown("---")
+    st.divider()
 
     # Recommendations
     st.subheader("💡 Next Steps")
 
-    recommendations = []
+    flags = {
+        "expand": profile_completeness < 0.6,
+        "validate": low_conf > high_conf,
+        "diversify": len(profile.data_sources) < 3,
+        "review": total_skills > 0,
+        "explore": total_skills > 0,
+    }
+    recommendations = "".join(
+        RECOMMENDATION_TEMPLATE.format(text=text)
+        for flag, text in DASHBOARD_RECOMMENDATIONS
+        if flags[flag]
+    )
+    st.markdown(recommendations, unsafe_allow_html=True)
+
+
+# Static welcome text, dedented once at import rather than on every rerun
+HOME_MARKDOWN = """\
+## Welcome to SkillSense!
 
-    if profile_completeness < 0.6:
-        recommendations.append("📌 **Expand Your Skills**: You have identified several skills. Consider adding more sources (references, projects) to discover additional competencies.")
+### What am I good at?
 
-    if low_conf > high_conf:
-        recommendations.append("📌 **Validate Your Skills**: You have many skills with medium or low confidence. Add more evidence from your CV or work samples to strengthen these.")
+SkillSense helps you discover and validate your hidden skills by analyzing data from multiple sources:
 
-    if len(profile.data_sources) < 3:
-        recommendations.append("📌 **Diversify Your Sources**: Adding a GitHub profile, personal statement, or references will provide a more comprehensive skill picture.")
+- **📄 CV/Resume**: Extract skills from your PDF resume
+- **💻 GitHub**: Analyze your repositories and code
+- **✍️ Personal Statement**: Assess communication and soft skills
+- **✉️ Reference Letters**: Validate skills through endorsements
 
-    if total_skills > 0:
-        recommendations.append("📌 **Review Your Profile**: Visit the **🎓 Skill Profile** page to see detailed skill breakdown and evidence.")
-        recommendations.append("📌 **Explore Job Matches**: Head to **💼 Job Matching** to discover opportunities that align with your skills.")
+### How it works:
 
-    for rec in recommendations:
-        st.info(rec, icon="✨")
+1. **Upload Your Data**: Provide your CV, GitHub username, or text information
+2. **AI Analysis**: Our NLP engine extracts both explicit and implicit skills
+3. **Skill Profile**: View your comprehensive skill profile with confidence scores
+4. **Job Matching**: Discover roles that match your skills and identify gaps
+5. **Export**: Download your profile for future use
+
+### Get Started
+
+Click on **📊 Data Input** in the sidebar to begin your skill analysis!
+"""
+
+
+NAV_PAGES = ("🏠 Home", "📊 Data Input", "📈 Dashboard", "🎓 Skill Profile", "💼 Job Matching", "💬 Employer Q&A", "💾 Export")
+ABOUT_TEXT = (
+    "SkillSense uses AI to analyze your CV, GitHub, and other sources "
+    "to identify your skills and match you with relevant job opportunities."
+)
+
+
+@st.fragment
+def render_demo_toggle():
+    """Demo mode toggle; flipping it reruns only this fragment, not the page"""
+    if st.checkbox("🎬 Load Demo Profile"):
+        st.info("Demo profile loaded with sample data")
+        # You can add a pre-built demo profile here
 
 
 def main():
@@ -1423,51 +1472,20 @@ def main():
     initialize_session_state()
     render_header()
 
-    # Sidebar navigation
+    # Sidebar navigation stays in the full run: the selected page drives the router
     st.sidebar.title("Navigation")
-    page = st.sidebar.radio(
-        "Go to:",
-        ["🏠 Home", "📊 Data Input", "📈 Dashboard", "🎓 Skill Profile", "💼 Job Matching", "💬 Employer Q&A", "💾 Export"]
-    )
+    page = st.sidebar.radio("Go to:", NAV_PAGES)
 
-    # Demo mode
-    if st.sidebar.checkbox("🎬 Load Demo Profile"):
-        st.sidebar.info("Demo profile loaded with sample data")
-        # You can add a pre-built demo profile here
+    with st.sidebar:
+        render_demo_toggle()
 
-    st.sidebar.markdown("---")
+    st.sidebar.divider()
     st.sidebar.markdown("### About")
-    st.sidebar.info(
-        "SkillSense uses AI to analyze your CV, GitHub, and other sources "
-        "to identify your skills and match you with relevant job opportunities."
-    )
+    st.sidebar.info(ABOUT_TEXT)
 
     # Route to pages
     if page == "🏠 Home":
-        st.markdown("""
-        ## Welcome to SkillSense!
-
-        ### What am I good at?
-
-        SkillSense helps you discover and validate your hidden skills by analyzing data from multiple sources:
-
-        - **📄 CV/Resume**: Extract skills from your PDF resume
-        - **💻 GitHub**: Analyze your repositories and code
-        - **✍️ Personal Statement**: Assess communication and soft skills
-        - **✉️ Reference Letters**: Validate skills through endorsements
-
-        ### How it works:
-
-        1. **Upload Your Data**: Provide your CV, GitHub username, or text information
-        2. **AI Analysis**: Our NLP engine extracts both explicit and implicit skills
-        3. **Skill Profile**: View your comprehensive skill profile with confidence scores
-        4. **Job Matching**: Discover roles that match your skills and identify gaps
-        5. **Export**: Download your profile for future use
-
-        ### Get Started
-
-        Click on **📊 Data Input** in the sidebar to begin your skill analysis!
-        """)
+        st.markdown(HOME_MARKDOWN)
 
     elif page == "📊 Data Input":
         st.markdown("### Provide Your Information")
@@ -9,9 +9,26 @@ from reportlab.lib.units import inch, cm
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_LEFT, TA_JUSTIFY, TA_CENTER
-import markdown2
 import os
 import re
+from functools import lru_cache
+
+# Markdown bold/italic -> ReportLab inline tags, compiled once and applied in order
+INLINE_MARKUP = (
+    (re.compile(r'\*\*(.*?)\*\*'), r'<b>\1</b>'),
+    (re.compile(r'\*(.*?)\*'), r'<i>\1</i>'),
+    (re.compile(r'__(.*?)__'), r'<b>\1</b>'),
+    (re.compile(r'_(.*?)_'), r'<i>\1</i>'),
+)
+
+
+@lru_cache(maxsize=2048)
+def inline_markup(text):
+    """Convert markdown bold/italic in one line to ReportLab tags, memoized for repeated lines"""
+    for pattern, replacement in INLINE_MARKUP:
+        text = pattern.sub(replacement, text)
+    return text
+
 
 # Read the markdown file
 markdown_file = "docs/PROJECT_RETROSPECTIVE.md"
@@ -24,7 +41,6 @@ doc = SimpleDocTemplate(output_file, pagesize=letter, topMargin=0.75*inch, botto
 
 # Define styles
 styles = getSampleStyleSheet()
-story = []
 
 # Custom styles
 title_style = ParagraphStyle(
@@ -66,62 +82,47 @@ body_style = ParagraphStyle(
     leading=16
 )
 
-# Parse and add content
-lines = md_content.split('\n')
-i = 0
-while i < len(lines):
-    line = lines[i]
-
-    # Title (H1)
-    if line.startswith('# ') and not line.startswith('## '):
-        title = line.replace('# ', '').strip()
-        story.append(Paragraph(title, title_style))
-        story.append(Spacer(1, 0.3*inch))
-        i += 1
-
-    # Heading 2
-    elif line.startswith('## '):
-        heading = line.replace('## ', '').strip()
-        story.append(Paragraph(heading, heading_style))
-        story.append(Spacer(1, 0.1*inch))
-        i += 1
-
-    # Heading 3
-    elif line.startswith('### '):
-        heading = line.replace('### ', '').strip()
-        story.append(Paragraph(heading, heading3_style))
-        story.append(Spacer(1, 0.08*inch))
-        i += 1
-
-    # Horizontal rule / Page break
-    elif line.strip() == '---':
-        story.append(Spacer(1, 0.2*inch))
-        story.append(PageBreak())
-        i += 1
-
-    # Empty line
-    elif line.strip() == '':
-        story.append(Spacer(1, 0.1*inch))
-        i += 1
-
-    # Regular paragraph (including bold/italic)
-    elif not line.startswith('|'):
-        # Skip code blocks for now (they'll be regular text)
-        if not line.startswith('```'):
+
+def flowables(lines):
+    """Yield the ReportLab flowables for each markdown line"""
+    for line in lines:
+        # Title (H1)
+        if line.startswith('# ') and not line.startswith('## '):
+            title = line.replace('# ', '').strip()
+            yield Paragraph(title, title_style)
+            yield Spacer(1, 0.3*inch)
+
+        # Heading 2
+        elif line.startswith('## '):
+            heading = line.replace('## ', '').strip()
+            yield Paragraph(heading, heading_style)
+            yield Spacer(1, 0.1*inch)
+
+        # Heading 3
+        elif line.startswith('### '):
+            heading = line.replace('### ', '').strip()
+            yield Paragraph(heading, heading3_style)
+            yield Spacer(1, 0.08*inch)
+
+        # Horizontal rule / Page break
+        elif line.strip() == '---':
+            yield Spacer(1, 0.2*inch)
+            yield PageBreak()
+
+        # Empty line
+        elif line.strip() == '':
+            yield Spacer(1, 0.1*inch)
+
+        # Regular paragraph (including bold/italic)
+        # Skip table rows and code fences for now (fenced lines are kept as regular text)
+        elif not line.startswith('|') and not line.startswith('```'):
             text = line.strip()
             if text:
-                # Convert markdown bold/italic
-                text = re.sub(r'\*\*(.*?)\*\*', r'<b>\1</b>', text)
-                text = re.sub(r'\*(.*?)\*', r'<i>\1</i>', text)
-                text = re.sub(r'__(.*?)__', r'<b>\1</b>', text)
-                text = re.sub(r'_(.*?)_', r'<i>\1</i>', text)
-
-                story.append(Paragraph(text, body_style))
-            i += 1
-        else:
-            i += 1
-    else:
-        i += 1
+                yield Paragraph(inline_markup(text), body_style)
+
+
+# Parse and add content
+story = list(flowables(md_content.split('\n')))
 
 # Build PDF
 try:
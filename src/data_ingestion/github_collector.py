@@ -3,6 +3,7 @@ GitHub Collector Module
 Collects repository data, languages, and project information from GitHub
 """
 from github import Github, GithubException
+from collections import Counter
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 import os
@@ -142,19 +143,15 @@ class GitHubCollector:
             Dictionary with extracted skills and insights
         """
         # Aggregate languages
-        language_stats = {}
+        language_stats = Counter()
         all_topics = []
         total_stars = 0
         total_forks = 0
         project_descriptions = []
 
         for repo in repos:
-            # Aggregate languages
-            for lang, bytes_count in repo.languages.items():
-                if lang in language_stats:
-                    language_stats[lang] += bytes_count
-                else:
-                    language_stats[lang] = bytes_count
+            # Aggregate languages (byte counts add up per language)
+            language_stats.update(repo.languages)
 
             # Collect topics
             all_topics.extend(repo.topics)
@@ -6,6 +6,7 @@ from typing import Dict, List, Optional
 from dataclasses import dataclass
 from datetime import datetime
 import re
+from collections import Counter
 
 
 @dataclass
@@ -170,14 +171,9 @@ class TextProcessor:
             if word not in stop_words and len(word) > 3
         ]
 
-        # Count frequency
-        word_freq = {}
-        for word in meaningful_words:
-            word_freq[word] = word_freq.get(word, 0) + 1
-
-        # Get top N
-        sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-        return [word for word, freq in sorted_words[:top_n]]
+        # Count frequency and get top N
+        word_freq = Counter(meaningful_words)
+        return [word for word, freq in word_freq.most_common(top_n)]
 
     def process_personal_statement(self, content: str) -> Dict[str, any]:
         """
@@ -3,11 +3,16 @@ Profile Builder
 Generates comprehensive skill profiles from multiple data sources
 """
 import json
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
+from operator import attrgetter
 import sys
+import uuid
 from pathlib import Path
+import numpy as np
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
@@ -19,6 +24,11 @@ from skill_extraction.skill_extractor import SkillExtractor
 from skill_extraction.confidence_scorer import ConfidenceScorer, ScoredSkill
 
 
+# Display confidence levels and the lower bound of each level above 'low'
+CONFIDENCE_LEVELS = ('low', 'medium', 'high')
+CONFIDENCE_LEVEL_THRESHOLDS = (0.5, 0.75)
+
+
 @dataclass
 class SkillProfile:
     """Complete skill profile for an individual"""
@@ -30,6 +40,77 @@ class SkillProfile:
     data_sources: List[str]
     metadata: Dict
     raw_data: Dict
+    confidences: np.ndarray = field(init=False, repr=False, compare=False)
+    confidence_levels: np.ndarray = field(init=False, repr=False, compare=False)
+    evidence_count: int = field(init=False, repr=False, compare=False)
+    level_counts: Dict[str, int] = field(init=False, repr=False, compare=False)
+    average_confidence: float = field(init=False, repr=False, compare=False)
+    skill_sources: List[str] = field(init=False, repr=False, compare=False)
+    category_labels: Dict[str, str] = field(init=False, repr=False, compare=False)
+    _filtered_categories: Dict[float, Dict[str, List[ScoredSkill]]] = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+
+    def __post_init__(self):
+        # Confidence column aligned with `skills`, for vectorized counts/filters
+        self.confidences = np.fromiter(
+            (s.final_confidence for s in self.skills), dtype=np.float64, count=len(self.skills)
+        )
+        # Index into CONFIDENCE_LEVELS per skill: 0 = low, 1 = medium, 2 = high
+        self.confidence_levels = np.digitize(self.confidences, CONFIDENCE_LEVEL_THRESHOLDS)
+        # Aggregates read by several pages on every rerun, fixed once the profile is built
+        self.level_counts = self.confidence_level_counts()
+        self.average_confidence = float(self.confidences.mean()) if self.skills else 0.0
+        self.evidence_count = sum(len(s.evidence) for s in self.skills)
+        self.skill_sources = sorted(set().union(*(s.sources for s in self.skills)))
+        # Display title per category, ordered by title for the category filter
+        self.category_labels = dict(sorted(
+            ((category, category.replace('_', ' ').title()) for category in self.skill_categories),
+            key=lambda item: item[1]
+        ))
+
+    def confidence_level_counts(self) -> Dict[str, int]:
+        """Number of skills per confidence level"""
+        counts = np.bincount(self.confidence_levels, minlength=len(CONFIDENCE_LEVELS))
+        return dict(zip(CONFIDENCE_LEVELS, counts.tolist()))
+
+    def top_skills_by_confidence(self, n: int) -> List[ScoredSkill]:
+        """
+        Highest-confidence skills, selected on the confidence column
+
+        Args:
+            n: Number of skills to return
+
+        Returns:
+            Up to n skills, highest final confidence first
+        """
+        if n >= len(self.skills):
+            order = np.argsort(-self.confidences, kind='stable')
+        else:
+            # Partition out the n largest, then sort only those
+            top = np.argpartition(-self.confidences, n)[:n]
+            order = top[np.argsort(-self.confidences[top], kind='stable')]
+        return [self.skills[i] for i in order]
+
+    def categories_above(self, confidence_min: float) -> Dict[str, List[ScoredSkill]]:
+        """
+        Category skill lists filtered to a minimum confidence, memoized per threshold
+
+        Args:
+            confidence_min: Minimum final confidence (rounded to 0.01 for the memo key)
+
+        Returns:
+            Dict of category -> skills, keeping the build-time confidence ordering
+        """
+        key = round(confidence_min, 2)
+        if key not in self._filtered_categories:
+            # One mask over the confidence column instead of a comparison per skill per category
+            passing = {id(self.skills[i]) for i in np.flatnonzero(self.confidences >= key)}
+            self._filtered_categories[key] = {
+                category: [s for s in skills if id(s) in passing]
+                for category, skills in self.skill_categories.items()
+            }
+        return self._filtered_categories[key]
 
 
 class ProfileBuilder:
@@ -75,6 +156,16 @@ class ProfileBuilder:
         if cv_path and not cv_paths:
             cv_paths = [cv_path]
 
+        # Start the network-bound GitHub fetch in the background so it overlaps CV parsing.
+        # PDF extraction stays on this thread: PyMuPDF is not thread-safe.
+        github_future = None
+        if github_username:
+            print(f"🐙 Fetching GitHub profile for {github_username} in the background...")
+            executor = ThreadPoolExecutor(max_workers=1)
+            github_future = executor.submit(self.github_collector.get_comprehensive_profile, github_username)
+            # Let the submitted fetch finish on its own; no further work is queued
+            executor.shutdown(wait=False)
+
         # Process CV(s) - supports multiple files
         if cv_paths:
             print(f"📄 Processing {len(cv_paths)} CV file(s)...")
@@ -108,9 +199,9 @@ class ProfileBuilder:
 
         # Process GitHub
         if github_username:
-            print(f"🐙 Fetching GitHub profile for {github_username}...")
+            print(f"🐙 Processing GitHub profile for {github_username}...")
             try:
-                github_data = self.github_collector.get_comprehensive_profile(github_username)
+                github_data = github_future.result()
 
                 # Extract skills from GitHub data
                 github_text = self._format_github_for_extraction(github_data)
@@ -199,6 +290,7 @@ class ProfileBuilder:
             skill_categories=skill_categories,
             data_sources=data_sources,
             metadata={
+                'profile_id': uuid.uuid4().hex,
                 'created_at': datetime.now().isoformat(),
                 'total_skills': len(filtered_skills),
                 'sources_count': len(data_sources)
@@ -259,7 +351,7 @@ class ProfileBuilder:
         return '\n'.join(text_parts)
 
     def _categorize_skills(self, scored_skills: List[ScoredSkill]) -> Dict[str, List[ScoredSkill]]:
-        """Organize skills by category"""
+        """Organize skills by category, each category sorted by confidence (highest first)"""
         categories = {}
 
         for skill in scored_skills:
@@ -268,6 +360,10 @@ class ProfileBuilder:
                 categories[category] = []
             categories[category].append(skill)
 
+        by_confidence = attrgetter('final_confidence')
+        for skills in categories.values():
+            skills.sort(key=by_confidence, reverse=True)
+
         return categories
 
     def _generate_summary(self, skills: List[ScoredSkill], sources: List[str]) -> str:
@@ -275,16 +371,9 @@ class ProfileBuilder:
         if not skills:
             return "No skills identified from available sources."
 
-        # Count by category
-        category_counts = {}
-        for skill in skills:
-            cat = skill.category
-            if cat not in category_counts:
-                category_counts[cat] = 0
-            category_counts[cat] += 1
-
-        # Get top categories
-        top_categories = sorted(category_counts.items(), key=lambda x: x[1], reverse=True)[:3]
+        # Count by category and get top categories
+        category_counts = Counter(skill.category for skill in skills)
+        top_categories = category_counts.most_common(3)
 
         # Build summary
         summary_parts = [
@@ -28,12 +28,22 @@ class RAGSystem:
         """
         self.profile = profile
         self.vector_store = FAISSVectorStore()
-        self.llm = LLMClient(provider=llm_provider, api_key=api_key)
-        self.conversation_history = []
+        self.set_llm(llm_provider, api_key)
 
         print(f"\nInitializing RAG system with {llm_provider}...")
         self._index_profile()
 
+    def set_llm(self, llm_provider: str, api_key: Optional[str] = None):
+        """
+        Switch the LLM provider, keeping the already indexed vector store
+
+        Args:
+            llm_provider: LLM provider to use ("gemini", "openai", "anthropic")
+            api_key: Optional API key
+        """
+        self.llm = LLMClient(provider=llm_provider, api_key=api_key)
+        self.conversation_history = []
+
     def _index_profile(self):
         """Index profile data for semantic search"""
         documents = []
@@ -231,6 +241,8 @@ class RAGSystem:
 
             source_info = {
                 "type": doc_type,
+                # Display label, formatted once here rather than on every UI rerun
+                "type_label": doc_type.replace('_', ' ').title(),
                 "text": doc['text'][:200] + "..." if len(doc['text']) > 200 else doc['text'],
                 "similarity": doc.get('similarity', 0),
                 "metadata": metadata
@@ -4,10 +4,17 @@ Fast semantic search for skill profiles using FAISS
 """
 import faiss
 import numpy as np
+from functools import lru_cache
 from typing import List, Dict, Optional
 from sentence_transformers import SentenceTransformer
 
 
+@lru_cache(maxsize=None)
+def _load_encoder(embedding_model: str) -> SentenceTransformer:
+    """Load a sentence transformer once per process and share it across stores"""
+    return SentenceTransformer(embedding_model)
+
+
 class FAISSVectorStore:
     """FAISS-based vector store for skill profile indexing"""
 
@@ -18,7 +25,7 @@ class FAISSVectorStore:
         Args:
             embedding_model: Sentence transformer model name
         """
-        self.encoder = SentenceTransformer(embedding_model)
+        self.encoder = _load_encoder(embedding_model)
         self.dimension = 384  # all-MiniLM-L6-v2 dimension
         self.index = faiss.IndexFlatL2(self.dimension)
         self.documents = []
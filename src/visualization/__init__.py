@@ -17,6 +17,7 @@ from .colors import (
     get_detection_color,
     get_source_color,
     get_match_color,
+    get_match_level,
     CUSTOM_CSS,
 )
 
@@ -39,6 +40,8 @@ from .charts import (
     create_required_vs_preferred,
     create_profile_completeness_gauge,
     create_skills_portfolio_bubble,
+    create_source_relevance_chart,
+    create_radar_chart,
 )
 
 from .layouts import (
@@ -49,7 +52,9 @@ from .layouts import (
     create_category_section,
     create_metrics_row,
     create_info_card,
+    create_info_card_html,
     create_skill_detail_card,
+    create_skill_detail_card_html,
 )
 
 __all__ = [
@@ -65,6 +70,7 @@ __all__ = [
     "get_detection_color",
     "get_source_color",
     "get_match_color",
+    "get_match_level",
     "CUSTOM_CSS",
 
     # Metrics
@@ -85,6 +91,8 @@ __all__ = [
     "create_required_vs_preferred",
     "create_profile_completeness_gauge",
     "create_skills_portfolio_bubble",
+    "create_source_relevance_chart",
+    "create_radar_chart",
 
     # Layouts
     "create_skill_badge_html",
@@ -94,5 +102,7 @@ __all__ = [
     "create_category_section",
     "create_metrics_row",
     "create_info_card",
+    "create_info_card_html",
     "create_skill_detail_card",
+    "create_skill_detail_card_html",
 ]
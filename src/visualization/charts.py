@@ -14,8 +14,10 @@ from .colors import (
     CONFIDENCE_COLORS,
     CATEGORY_COLORS,
     DETECTION_COLORS,
+    MATCH_SCORE_COLORS,
     get_confidence_color,
     get_category_color,
+    get_match_level,
 )
 
 
@@ -266,18 +268,9 @@ def create_match_score_gauge(score: float, title: str = "Match Score") -> go.Fig
     """
     percentage = score * 100
 
-    if score >= 0.8:
-        color = "#10B981"  # Green
-        level = "Excellent"
-    elif score >= 0.6:
-        color = "#06B6D4"  # Cyan
-        level = "Good"
-    elif score >= 0.4:
-        color = "#F59E0B"  # Amber
-        level = "Fair"
-    else:
-        color = "#EF4444"  # Red
-        level = "Poor"
+    match_level = get_match_level(score)
+    color = MATCH_SCORE_COLORS[match_level]
+    level = match_level.title()
 
     fig = go.Figure(
         data=[
@@ -504,3 +497,86 @@ def create_skills_portfolio_bubble(
     )
 
     return fig
+
+
+@st.cache_data(show_spinner=False)
+def create_source_relevance_chart(
+    source_types: Tuple[str, ...],
+    similarities: Tuple[float, ...],
+) -> go.Figure:
+    """
+    Create horizontal bar chart of RAG evidence source relevance.
+
+    Args:
+        source_types: Display name of each retrieved source
+        similarities: Similarity score (0.0-1.0) of each source, aligned with source_types
+
+    Returns:
+        Plotly Figure
+    """
+    fig = go.Figure(
+        data=[
+            go.Bar(
+                y=list(source_types),
+                x=list(similarities),
+                orientation="h",
+                # Bars carry their own score labels, so the color scale needs no colorbar
+                marker=dict(
+                    color=list(similarities),
+                    colorscale="RdYlGn",
+                    cmin=0,
+                    cmax=1,
+                ),
+                text=[f"{sim:.2f}" for sim in similarities],
+                textposition="outside",
+            )
+        ]
+    )
+
+    fig.update_layout(
+        title="Evidence Source Relevance Scores",
+        xaxis_title="Relevance Score",
+        yaxis_title="Source Type",
+        height=250,
+        margin=dict(l=150, r=50, t=80, b=50),
+        template="plotly_white",
+    )
+
+    return fig
+
+
+@st.cache_data
+def create_radar_chart(skills: Tuple[Tuple[str, float], ...]) -> go.Figure:
+    """
+    Create radar chart for top skills.
+
+    Args:
+        skills: Tuple of (skill_name, confidence) pairs
+
+    Returns:
+        Plotly Figure
+    """
+    skill_names = [name[:20] for name, _ in skills]  # Truncate long names
+    confidences = [confidence for _, confidence in skills]
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Scatterpolar(
+        r=confidences,
+        theta=skill_names,
+        fill="toself",
+        name="Confidence Level",
+    ))
+
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 1],
+            )
+        ),
+        showlegend=False,
+        title="Top Skills Confidence Radar",
+    )
+
+    return fig
@@ -4,6 +4,8 @@ SkillSense Color Palette & Theme Configuration
 Defines the complete color system for consistent UI styling.
 """
 
+from bisect import bisect_right
+
 # Primary Color Palette
 COLOR_PALETTE = {
     "primary": "#003B73",        # Navy blue
@@ -73,18 +75,16 @@ MATCH_SCORE_COLORS = {
 }
 
 
+# Lower bound of each confidence color band above "very_low", and the band colors in order
+CONFIDENCE_COLOR_THRESHOLDS = (0.3, 0.5, 0.7, 0.9)
+CONFIDENCE_COLOR_BANDS = tuple(
+    CONFIDENCE_COLORS[level] for level in ("very_low", "low", "medium", "high", "very_high")
+)
+
+
 def get_confidence_color(confidence: float) -> str:
     """Get color based on confidence score (0.0-1.0)"""
-    if confidence >= 0.9:
-        return CONFIDENCE_COLORS["very_high"]
-    elif confidence >= 0.7:
-        return CONFIDENCE_COLORS["high"]
-    elif confidence >= 0.5:
-        return CONFIDENCE_COLORS["medium"]
-    elif confidence >= 0.3:
-        return CONFIDENCE_COLORS["low"]
-    else:
-        return CONFIDENCE_COLORS["very_low"]
+    return CONFIDENCE_COLOR_BANDS[bisect_right(CONFIDENCE_COLOR_THRESHOLDS, confidence)]
 
 
 def get_category_color(category: str) -> str:
@@ -102,16 +102,19 @@ def get_source_color(source: str) -> str:
     return SOURCE_COLORS.get(source, COLOR_PALETTE["primary"])
 
 
+# Lower bound of each match band above "poor", and the band levels in order
+MATCH_SCORE_THRESHOLDS = (0.4, 0.6, 0.8)
+MATCH_SCORE_LEVELS = ("poor", "fair", "good", "excellent")
+
+
+def get_match_level(score: float) -> str:
+    """Get match band name ("poor" .. "excellent") for a match score (0.0-1.0)"""
+    return MATCH_SCORE_LEVELS[bisect_right(MATCH_SCORE_THRESHOLDS, score)]
+
+
 def get_match_color(score: float) -> str:
     """Get color based on match score (0.0-1.0)"""
-    if score >= 0.8:
-        return MATCH_SCORE_COLORS["excellent"]
-    elif score >= 0.6:
-        return MATCH_SCORE_COLORS["good"]
-    elif score >= 0.4:
-        return MATCH_SCORE_COLORS["fair"]
-    else:
-        return MATCH_SCORE_COLORS["poor"]
+    return MATCH_SCORE_COLORS[get_match_level(score)]
 
 
 # CSS for custom styling
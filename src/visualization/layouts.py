@@ -6,7 +6,7 @@ Provides grid layouts, card containers, and UI structure helpers.
 
 import streamlit as st
 from typing import List, Dict, Optional, Callable
-from .colors import COLOR_PALETTE, get_confidence_color, get_category_color
+from .colors import COLOR_PALETTE, get_confidence_color, get_category_color, get_match_color
 
 
 def create_skill_badge_html(
@@ -92,15 +92,7 @@ def create_job_card(
         description: Job description
     """
     match_percentage = int(match_score * 100)
-
-    if match_score >= 0.8:
-        color = "#10B981"
-    elif match_score >= 0.6:
-        color = "#06B6D4"
-    elif match_score >= 0.4:
-        color = "#F59E0B"
-    else:
-        color = "#EF4444"
+    color = get_match_color(match_score)
 
     company_html = f'<div style="font-size: 0.875rem; color: #6B7280; margin-bottom: 0.5rem;">{company}</div>' if company else ""
     desc_html = f'<div style="font-size: 0.875rem; color: #6B7280; margin-top: 1rem; line-height: 1.5;">{description}</div>' if description else ""
@@ -187,61 +179,58 @@ def create_metrics_row(
             )
 
 
-def create_info_card(
+def create_info_card_html(
     title: str,
     content: str,
     color: str = "primary",
     icon: str = "ℹ️",
-) -> None:
+) -> str:
     """
-    Create an information card.
+    Create HTML for an information card.
 
     Args:
         title: Card title
         content: Card content
         color: Color theme
         icon: Icon emoji
+
+    Returns:
+        HTML string for the card
     """
     border_color = COLOR_PALETTE.get(color, COLOR_PALETTE["primary"])
 
-    card_html = f"""
-    <div style="
-        padding: 1.5rem;
-        border-radius: 12px;
-        background: {border_color}10;
-        border-left: 4px solid {border_color};
-        border: 1px solid {border_color}30;
-    ">
-        <div style="
-            font-size: 1rem;
-            font-weight: 600;
-            color: {border_color};
-            margin-bottom: 0.5rem;
-        ">
-            {icon} {title}
-        </div>
-        <div style="
-            font-size: 0.875rem;
-            color: #374151;
-            line-height: 1.5;
-        ">
-            {content}
-        </div>
-    </div>
+    return f'<div style="padding: 1.5rem; border-radius: 12px; background: {border_color}10; border-left: 4px solid {border_color}; border: 1px solid {border_color}30;"><div style="font-size: 1rem; font-weight: 600; color: {border_color}; margin-bottom: 0.5rem;">{icon} {title}</div><div style="font-size: 0.875rem; color: #374151; line-height: 1.5;">{content}</div></div>'
+
+
+def create_info_card(
+    title: str,
+    content: str,
+    color: str = "primary",
+    icon: str = "ℹ️",
+) -> None:
+    """
+    Create an information card.
+
+    Args:
+        title: Card title
+        content: Card content
+        color: Color theme
+        icon: Icon emoji
     """
+    card_html = create_info_card_html(title, content, color, icon)
 
     st.markdown(card_html, unsafe_allow_html=True)
 
 
-def create_skill_detail_card(
+def create_skill_detail_card_html(
     skill_name: str,
     confidence: float,
     category: str,
     sources: List[str],
     evidence: List[str],
-) -> None:
+) -> str:
     """
-    Create a detailed card for a single skill.
+    Create HTML for a detailed skill card.
 
     Args:
         skill_name: Skill name
@@ -249,6 +238,9 @@ def create_skill_detail_card(
         category: Skill category
         sources: List of sources where detected
         evidence: List of evidence snippets
+
+    Returns:
+        HTML string for the card
     """
     color = get_confidence_color(confidence)
     category_color = get_category_color(category)
@@ -263,6 +255,26 @@ def create_skill_detail_card(
         for evidence in evidence
     ])
 
-    card_html = f'<div style="padding: 1.5rem; border-radius: 12px; background: white; border: 1px solid #E5E7EB; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.07);"><div style="display: flex; justify-content: space-between; align-items: start; margin-bottom: 1rem;"><div><div style="font-size: 1.5rem; font-weight: 700; color: #0F172A;">{skill_name}</div><div style="font-size: 0.875rem; color: #6B7280; margin-top: 0.25rem;">{category.replace("_", " ").title()}</div></div><div style="display: flex; flex-direction: column; align-items: center; gap: 0.5rem;"><div style="font-size: 1.875rem; font-weight: 700; color: {color};">{confidence:.0%}</div><div style="font-size: 0.75rem; color: #6B7280;">Confidence</div></div></div><div style="margin-bottom: 1rem; padding-bottom: 1rem; border-bottom: 1px solid #E5E7EB;"><div style="font-size: 0.875rem; color: #6B7280; margin-bottom: 0.5rem; font-weight: 500;">Detected in:</div>{sources_html}</div><div><div style="font-size: 0.875rem; color: #6B7280; margin-bottom: 0.5rem; font-weight: 500;">Evidence:</div>{evidence_html if evidence_html else "<div style=\"color: #9CA3AF; font-size: 0.875rem;\">No evidence available</div>"}</div></div>'
+    return f'<div style="padding: 1.5rem; margin-bottom: 1rem; border-radius: 12px; background: white; border: 1px solid #E5E7EB; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.07);"><div style="display: flex; justify-content: space-between; align-items: start; margin-bottom: 1rem;"><div><div style="font-size: 1.5rem; font-weight: 700; color: #0F172A;">{skill_name}</div><div style="font-size: 0.875rem; color: #6B7280; margin-top: 0.25rem;">{category.replace("_", " ").title()}</div></div><div style="display: flex; flex-direction: column; align-items: center; gap: 0.5rem;"><div style="font-size: 1.875rem; font-weight: 700; color: {color};">{confidence:.0%}</div><div style="font-size: 0.75rem; color: #6B7280;">Confidence</div></div></div><div style="margin-bottom: 1rem; padding-bottom: 1rem; border-bottom: 1px solid #E5E7EB;"><div style="font-size: 0.875rem; color: #6B7280; margin-bottom: 0.5rem; font-weight: 500;">Detected in:</div>{sources_html}</div><div><div style="font-size: 0.875rem; color: #6B7280; margin-bottom: 0.5rem; font-weight: 500;">Evidence:</div>{evidence_html if evidence_html else "<div style=\"color: #9CA3AF; font-size: 0.875rem;\">No evidence available</div>"}</div></div>'
+
+
+def create_skill_detail_card(
+    skill_name: str,
+    confidence: float,
+    category: str,
+    sources: List[str],
+    evidence: List[str],
+) -> None:
+    """
+    Create a detailed card for a single skill.
+
+    Args:
+        skill_name: Skill name
+        confidence: Confidence score
+        category: Skill category
+        sources: List of sources where detected
+        evidence: List of evidence snippets
+    """
+    card_html = create_skill_detail_card_html(skill_name, confidence, category, sources, evidence)
 
     st.markdown(card_html, unsafe_allow_html=True)